@@ -1661,7 +1661,6 @@ class Boss(pygame.sprite.Sprite):
                         self.game_ref.all_sprites,  # Group 1
                         self.game_ref.powerups,     # Group 2
                         particles_group=self.game_ref.particles, # Keyword arg
-                        game_ref=self.game_ref                   # Keyword arg
                     )
                 except Exception as e:
                     logger.error(f"Error spawning Power Restore powerup: {e}")
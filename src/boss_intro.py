@@ -238,6 +238,11 @@ class BossIntroSequence:
         self.glitch_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         self.stars_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         
+        # Decode the boss sounds before the first intro frame is rendered,
+        # so neither the siren nor the boss explosion stalls a frame later
+        if self.sound_manager:
+            self.sound_manager.preload("siren1", "bossexplode1", category="enemy")
+
         # Play siren sound
         self._setup_audio()
         
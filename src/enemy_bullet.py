@@ -2,6 +2,9 @@
 
 import random
 import math
+from typing import ClassVar, Optional, Tuple
+
+import numpy as np
 import pygame
 
 from config.config import (
@@ -16,19 +19,46 @@ logger = get_logger(__name__)
 # Core bullet parameters
 ENEMY_BULLET_SPEED = 5
 BULLET_SIZE = (8, 8)
+BULLET_COLORKEY = (0, 0, 0)  # Transparent background of opaque bullet images
+
+
+class SharedImageMixin:
+    """Gives a bullet class one image and mask shared by all its instances.
+
+    Subclasses set SIZE and implement _draw_image; the pair is built on
+    first use because surfaces can only be converted once a display exists.
+    """
+
+    SIZE: ClassVar[Tuple[int, int]]
+    _IMAGE: ClassVar[Optional[pygame.Surface]] = None
+    _MASK: ClassVar[Optional[pygame.mask.Mask]] = None
 
+    @classmethod
+    def _shared_image(cls) -> Tuple[pygame.Surface, pygame.mask.Mask]:
+        """Return the class's shared image and mask, building them on first use."""
+        # Look in the class's own namespace so subclasses never reuse a
+        # parent's image
+        if cls.__dict__.get("_IMAGE") is None:
+            image = cls._draw_image()
+            cls._IMAGE = image
+            cls._MASK = pygame.mask.from_surface(image)
+        return cls._IMAGE, cls._MASK
 
-class EnemyBullet(pygame.sprite.Sprite):
+    @classmethod
+    def _draw_image(cls) -> pygame.Surface:
+        """Draw the image shared by every instance of the class."""
+        raise NotImplementedError
+
+
+class EnemyBullet(SharedImageMixin, pygame.sprite.Sprite):
     """Basic bullet fired by enemies toward the player."""
 
+    SIZE = BULLET_SIZE
+
     def __init__(self, start_pos: tuple, target_pos: tuple, *groups) -> None:
         super().__init__(*groups)
-        self.image = pygame.Surface(BULLET_SIZE, pygame.SRCALPHA)
-        pygame.draw.circle(
-            self.image, (255, 0, 0), (BULLET_SIZE[0] // 2, BULLET_SIZE[1] // 2), BULLET_SIZE[0] // 2
-        )
+        self.image, self.mask = self._shared_image()
         self.rect = self.image.get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.image)
 
         dx = target_pos[0] - start_pos[0]
         dy = target_pos[1] - start_pos[1]
@@ -40,6 +70,20 @@ class EnemyBullet(pygame.sprite.Sprite):
             norm_dy = dy / distance
             self.velocity = (norm_dx * ENEMY_BULLET_SPEED, norm_dy * ENEMY_BULLET_SPEED)
 
+    @classmethod
+    def _draw_image(cls) -> pygame.Surface:
+        """Render the red bullet circle once for all enemy bullets."""
+        # The bullet is fully opaque, so a colorkeyed surface avoids
+        # per-pixel alpha blending on every blit
+        size = cls.SIZE
+        image = pygame.Surface(size)
+        image.fill(BULLET_COLORKEY)
+        image.set_colorkey(BULLET_COLORKEY)
+        pygame.draw.circle(
+            image, (255, 0, 0), (size[0] // 2, size[1] // 2), size[0] // 2
+        )
+        return image
+
     def update(self) -> None:
         self.rect.x += self.velocity[0]
         self.rect.y += self.velocity[1]
@@ -53,23 +97,17 @@ class EnemyBullet(pygame.sprite.Sprite):
             self.kill()
 
 
-class BouncingBullet(pygame.sprite.Sprite):
+class BouncingBullet(SharedImageMixin, pygame.sprite.Sprite):
     """Bullet that bounces off screen boundaries."""
 
+    SIZE = (12, 12)
+
     def __init__(self, start_pos: tuple, angle: float, *groups) -> None:
         super().__init__(*groups)
 
         # Create a larger blue bullet
-        self.size = (12, 12)
-        self.image = pygame.Surface(self.size, pygame.SRCALPHA)
-        pygame.draw.circle(
-            self.image,
-            (0, 100, 255),  # Blue color
-            (self.size[0] // 2, self.size[1] // 2),
-            self.size[0] // 2,
-        )
+        self.image, self.mask = self._shared_image()
         self.rect = self.image.get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.image)
 
         # Use the provided angle instead of a random one
         speed = ENEMY_BULLET_SPEED * 0.8  # Slightly slower
@@ -86,14 +124,26 @@ class BouncingBullet(pygame.sprite.Sprite):
         self.pos_x = float(self.rect.x)
         self.pos_y = float(self.rect.y)
 
+    @classmethod
+    def _draw_image(cls) -> pygame.Surface:
+        """Render the blue bullet once for all bouncing bullets."""
+        size = cls.SIZE
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(
+            image,
+            (0, 100, 255),  # Blue color
+            (size[0] // 2, size[1] // 2),
+            size[0] // 2,
+        )
+        return image
+
     def update(self) -> None:
         # Update position
         self.pos_x += self.velocity[0]
         self.pos_y += self.velocity[1]
 
-        # Update rect from float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect from float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
         # Bounce off screen boundaries
         bounced = False
@@ -131,32 +181,17 @@ class BouncingBullet(pygame.sprite.Sprite):
                 self.kill()
 
 
-class SpiralBullet(pygame.sprite.Sprite):
+class SpiralBullet(SharedImageMixin, pygame.sprite.Sprite):
     """Bullet that moves in a spiral pattern."""
 
+    SIZE = (10, 10)
+
     def __init__(self, start_pos: tuple, angle: float, *groups) -> None:
         super().__init__(*groups)
 
         # Create a green spiral bullet
-        self.size = (10, 10)
-        self.image = pygame.Surface(self.size, pygame.SRCALPHA)
-        pygame.draw.circle(
-            self.image,
-            (0, 255, 100),  # Green color
-            (self.size[0] // 2, self.size[1] // 2),
-            self.size[0] // 2,
-        )
-
-        # Add a white dot in the center for visual effect
-        pygame.draw.circle(
-            self.image,
-            (255, 255, 255),  # White color
-            (self.size[0] // 2, self.size[1] // 2),
-            self.size[0] // 6,  # Smaller radius
-        )
-
+        self.image, self.mask = self._shared_image()
         self.rect = self.image.get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.image)
 
         # Spiral movement parameters
         self.angle = angle  # Starting angle in degrees
@@ -177,6 +212,27 @@ class SpiralBullet(pygame.sprite.Sprite):
         self.max_lifetime = 180  # 3 seconds at 60 FPS
         self.lifetime = 0
 
+    @classmethod
+    def _draw_image(cls) -> pygame.Surface:
+        """Render the green spiral bullet once for all spiral bullets."""
+        size = cls.SIZE
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(
+            image,
+            (0, 255, 100),  # Green color
+            (size[0] // 2, size[1] // 2),
+            size[0] // 2,
+        )
+
+        # Add a white dot in the center for visual effect
+        pygame.draw.circle(
+            image,
+            (255, 255, 255),  # White color
+            (size[0] // 2, size[1] // 2),
+            size[0] // 6,  # Smaller radius
+        )
+        return image
+
     def update(self) -> None:
         # Increment lifetime
         self.lifetime += 1
@@ -202,9 +258,8 @@ class SpiralBullet(pygame.sprite.Sprite):
         self.pos_x = self.center_pos[0] + offset_x
         self.pos_y = self.center_pos[1] + offset_y
 
-        # Update rect from float position
-        self.rect.centerx = round(self.pos_x)
-        self.rect.centery = round(self.pos_y)
+        # Update rect from float position; Rect rounds floats itself
+        self.rect.center = (self.pos_x, self.pos_y)
 
         # Kill the bullet if it goes off screen
         if (
@@ -271,9 +326,8 @@ class ExplosiveBullet(pygame.sprite.Sprite):
         self.pos_x += self.velocity[0]
         self.pos_y += self.velocity[1]
 
-        # Update rect from float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect from float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
         # Decrease fuse timer
         self.fuse -= 1
@@ -331,23 +385,17 @@ class ExplosiveBullet(pygame.sprite.Sprite):
             fragment = ExplosionFragment(self.rect.center, angle, self.bullet_group)
 
 
-class ExplosionFragment(pygame.sprite.Sprite):
+class ExplosionFragment(SharedImageMixin, pygame.sprite.Sprite):
     """Small fragment created when an explosive bullet explodes."""
 
+    SIZE = (6, 6)
+
     def __init__(self, start_pos: tuple, angle: float, *groups) -> None:
         super().__init__(*groups)
 
         # Create a small red fragment
-        self.size = (6, 6)
-        self.image = pygame.Surface(self.size, pygame.SRCALPHA)
-        pygame.draw.circle(
-            self.image,
-            (255, 50, 50),  # Red color
-            (self.size[0] // 2, self.size[1] // 2),
-            self.size[0] // 2,
-        )
+        self.image, self.mask = self._shared_image()
         self.rect = self.image.get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.image)
 
         # Set velocity based on angle
         speed = ENEMY_BULLET_SPEED * 1.2  # Faster than normal bullets
@@ -361,14 +409,26 @@ class ExplosionFragment(pygame.sprite.Sprite):
         # Short lifetime
         self.lifetime = 45  # 0.75 seconds at 60 FPS
 
+    @classmethod
+    def _draw_image(cls) -> pygame.Surface:
+        """Render the red fragment once for all explosion fragments."""
+        size = cls.SIZE
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(
+            image,
+            (255, 50, 50),  # Red color
+            (size[0] // 2, size[1] // 2),
+            size[0] // 2,
+        )
+        return image
+
     def update(self) -> None:
         # Update position
         self.pos_x += self.velocity[0]
         self.pos_y += self.velocity[1]
 
-        # Update rect from float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect from float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
         # Decrease lifetime
         self.lifetime -= 1
@@ -477,9 +537,8 @@ class HomingBullet(pygame.sprite.Sprite):
         self.pos_x += self.velocity[0]
         self.pos_y += self.velocity[1]
 
-        # Update rect from float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect from float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
         # Kill the bullet if it goes off screen
         if (
@@ -525,9 +584,11 @@ class HomingBullet(pygame.sprite.Sprite):
         )
 
 
-class WaveBullet(pygame.sprite.Sprite):
+class WaveBullet(SharedImageMixin, pygame.sprite.Sprite):
     """Bullet that moves in a wave pattern."""
 
+    SIZE = (10, 10)
+
     def __init__(self, start_pos: tuple, direction: int = -1, *groups) -> None:
         """Initialize a wave bullet.
 
@@ -539,27 +600,8 @@ class WaveBullet(pygame.sprite.Sprite):
         super().__init__(*groups)
 
         # Create a cyan wave bullet
-        self.size = (10, 10)
-        self.image = pygame.Surface(self.size, pygame.SRCALPHA)
-
-        # Outer cyan circle
-        pygame.draw.circle(
-            self.image,
-            (0, 200, 255),  # Cyan color
-            (self.size[0] // 2, self.size[1] // 2),
-            self.size[0] // 2,
-        )
-
-        # Draw triangular shape inside to indicate direction
-        center_x, center_y = self.size[0] // 2, self.size[1] // 2
-        pygame.draw.polygon(
-            self.image,
-            (0, 255, 255),  # Brighter cyan
-            [(center_x - 3, center_y), (center_x + 3, center_y - 3), (center_x + 3, center_y + 3)],
-        )
-
+        self.image, self.mask = self._shared_image()
         self.rect = self.image.get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.image)
 
         # Movement parameters
         self.direction = direction  # Travel direction
@@ -577,6 +619,29 @@ class WaveBullet(pygame.sprite.Sprite):
         self.max_lifetime = 180  # 3 seconds at 60 FPS
         self.lifetime = 0
 
+    @classmethod
+    def _draw_image(cls) -> pygame.Surface:
+        """Render the cyan wave bullet once for all wave bullets."""
+        size = cls.SIZE
+        image = pygame.Surface(size, pygame.SRCALPHA)
+
+        # Outer cyan circle
+        pygame.draw.circle(
+            image,
+            (0, 200, 255),  # Cyan color
+            (size[0] // 2, size[1] // 2),
+            size[0] // 2,
+        )
+
+        # Draw triangular shape inside to indicate direction
+        center_x, center_y = size[0] // 2, size[1] // 2
+        pygame.draw.polygon(
+            image,
+            (0, 255, 255),  # Brighter cyan
+            [(center_x - 3, center_y), (center_x + 3, center_y - 3), (center_x + 3, center_y + 3)],
+        )
+        return image
+
     def update(self) -> None:
         # Update lifetime
         self.lifetime += 1
@@ -596,9 +661,8 @@ class WaveBullet(pygame.sprite.Sprite):
         # Apply wave offset to y position
         self.pos_y = self.base_y + wave_offset
 
-        # Update rect from float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect from float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
         # Kill the bullet if it goes off screen
         if (
@@ -648,6 +712,12 @@ class LaserBeam(pygame.sprite.Sprite):
         
         # We'll initialize the mask later after creating the actual image
         self.mask = None
+
+        # Beam bodies drawn during the steady phase, keyed by flicker widths
+        self._body_cache = {}
+        # Per-column fade table for the current beam length
+        self._fade_width = -1
+        self._fade_table = None
         
         # Update the image for the first time
         self.update_image()
@@ -664,90 +734,69 @@ class LaserBeam(pygame.sprite.Sprite):
         # Create surface for laser (add a few pixels extra for glow effects)
         surface_width = max(1, self.current_length)
         surface_height = self.width + 8
-        
-        # Create a new surface
-        self.image = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
-        
+
         # Calculate center of height for drawing
         center_y = surface_height // 2
-        
+
         # Calculate flicker effect
         flicker = 1.0 + math.sin(self.flicker_time) * self.flicker_amount
-        
-        # Draw glow effect (wider beam with lower alpha)
         glow_width = int(self.width * 1.8 * flicker)
-        glow_alpha = int(self.alpha * 0.4)
-        glow_color = (255, 100, 100, glow_alpha)  # Lighter red glow
-        
-        # Draw the glow with fade-in effect at the beginning (right side)
-        for x in range(surface_width):
-            # Calculate fade-in factor (0-1) for the right side (beginning of beam at enemy)
-            beginning_fade = min(1.0, (surface_width - x) / self.beam_start_effect_length) if self.beam_start_effect_length > 0 else 1.0
-            current_glow_alpha = int(glow_alpha * beginning_fade)
-            current_glow_color = (255, 100, 100, current_glow_alpha)
-            
-            # Intensity increases toward beam center
-            glow_rect = pygame.Rect(x, center_y - glow_width//2, 1, glow_width)
-            pygame.draw.rect(self.image, current_glow_color, glow_rect)
-        
-        # Calculate core beam width with flicker
         core_width = int(self.width * flicker)
-        
-        # Draw main beam core with fade-in at the beginning (right side)
-        for x in range(surface_width):
-            # Calculate gradient position (0 to 1)
-            pos = x / surface_width if surface_width > 0 else 0
-            
-            # Calculate fade-in factor (0-1) for the right side (beginning of beam at enemy)
-            beginning_fade = min(1.0, (surface_width - x) / self.beam_start_effect_length) if self.beam_start_effect_length > 0 else 1.0
-            
-            # Start with bright white/red, fade to darker red
-            r = 255
-            g = max(50, 200 - int(150 * pos))
-            b = max(50, 200 - int(150 * pos))
-            
-            # Apply beginning fade
-            current_alpha = int(self.alpha * beginning_fade)
-            beam_color = (r, g, b, current_alpha)
-            
-            # Draw vertical line for beam core
-            pygame.draw.line(self.image, beam_color, 
-                            (x, center_y - core_width//2 * beginning_fade), 
-                            (x, center_y + core_width//2 * beginning_fade), 1)
-        
-        # Draw intense center line with fade-in at beginning (right side)
-        for x in range(surface_width):
-            beginning_fade = min(1.0, (surface_width - x) / self.beam_start_effect_length) if self.beam_start_effect_length > 0 else 1.0
-            center_alpha = int(self.alpha * beginning_fade)
-            center_color = (255, 255, 255, center_alpha)  # Bright white with variable alpha
-            if x < surface_width - 1:  # Avoid IndexError
-                pygame.draw.line(self.image, center_color, (x, center_y), (x+1, center_y), 2)
-        
-        # Add some energy particles at the start of the beam
+
+        # Once the beam reaches full length, the body only varies with the
+        # flicker widths, so reuse bodies drawn on earlier frames; while
+        # fading out, the full-alpha body is faded with the surface alpha
+        # instead of being redrawn every frame
+        steady = not self.charge_active and self.current_length >= self.max_length
+        fading = steady and self.alpha < 255
+        cached = self._body_cache.get((glow_width, core_width)) if steady else None
+        if cached is not None:
+            body, body_mask = cached
+        else:
+            body = self._draw_body(
+                surface_width, surface_height, glow_width, core_width,
+                255 if steady else self.alpha,
+            )
+            # A fading beam gets its mask from its current alpha below, and
+            # only full-alpha pairs are cached
+            body_mask = None
+            if not fading:
+                body_mask = self._build_mask(surface_width, surface_height, core_width)
+                if steady:
+                    self._body_cache[(glow_width, core_width)] = (body, body_mask)
+        if fading:
+            body = body.copy()
+            body.set_alpha(self.alpha)
+            body_mask = self._build_mask(surface_width, surface_height, core_width)
+        self.image = body
+
+        # Add some energy particles at the start of the beam, on a copy so
+        # a cached body stays clean; a fading copy already applies the alpha
         if self.current_length > 20 and random.random() < 0.7:
+            if steady and not fading:
+                self.image = body.copy()
             particle_size = random.randint(1, 3)
             particle_x = random.randint(0, 15)
             particle_y = random.randint(center_y - core_width//2, center_y + core_width//2)
-            particle_color = (255, 230, 230, self.alpha)
+            particle_color = (255, 230, 230, 255 if fading else self.alpha)
             pygame.draw.circle(self.image, particle_color, (particle_x, particle_y), particle_size)
             
         # Draw charging effect at the origin of the beam (right side)
         if self.charge_active and self.beam_charge_alpha > 20:
             charge_size = self.charge_size * (0.8 + 0.4 * math.sin(self.flicker_time * 2))
-            # Create a radial glow at the start of the beam
+            # Create a radial glow at the start of the beam; loop invariants
+            # are bound to locals once
+            image = self.image
+            draw_circle = pygame.draw.circle
+            charge_alpha_max = self.beam_charge_alpha
+            charge_center = (surface_width - 1, center_y)
             for radius in range(int(charge_size), 0, -2):
-                ratio = radius / charge_size
-                charge_alpha = int(self.beam_charge_alpha * ratio)
-                charge_color = (255, 200, 200, charge_alpha)
-                pygame.draw.circle(self.image, charge_color, 
-                                (surface_width-1, center_y), 
-                                radius)
+                charge_alpha = int(charge_alpha_max * (radius / charge_size))
+                draw_circle(image, (255, 200, 200, charge_alpha), charge_center, radius)
             
             # Add bright center to the charge effect
-            center_charge_color = (255, 255, 255, self.beam_charge_alpha)
-            pygame.draw.circle(self.image, center_charge_color, 
-                            (surface_width-1, center_y), 
-                            charge_size * 0.3)
+            center_charge_color = (255, 255, 255, charge_alpha_max)
+            draw_circle(image, center_charge_color, charge_center, charge_size * 0.3)
         
         # Save the previous rect position before updating
         old_right = self.rect.right if hasattr(self, 'rect') else 0
@@ -757,8 +806,139 @@ class LaserBeam(pygame.sprite.Sprite):
         self.rect.right = old_right or self.start_pos[0]
         self.rect.centery = self.start_pos[1]
         
-        # Update mask
-        self.mask = pygame.mask.from_surface(self.image)
+        # Update mask; particles and the charge glow are decorative
+        self.mask = body_mask
+
+    def _beginning_fade(self, surface_width: int) -> np.ndarray:
+        """Fade-in factor (0-1) per column for the right side (beginning of beam at enemy).
+
+        The table only depends on the width, so it is kept until the beam
+        length changes; callers must treat it as read-only.
+        """
+        if surface_width != self._fade_width:
+            if self.beam_start_effect_length > 0:
+                columns = np.arange(surface_width)
+                self._fade_table = np.minimum(1.0, (surface_width - columns) / self.beam_start_effect_length)
+            else:
+                self._fade_table = np.ones(surface_width)
+            self._fade_width = surface_width
+        return self._fade_table
+
+    def _build_mask(
+        self, surface_width: int, surface_height: int, core_width: int
+    ) -> pygame.mask.Mask:
+        """Build the beam's collision mask from its geometry.
+
+        Matches mask.from_surface on the body without scanning pixels: the
+        glow never passes the default alpha threshold of 127, so only core
+        and center line columns whose alpha exceeds it are set.
+
+        Args:
+            surface_width: Width of the beam surface (current beam length)
+            surface_height: Height of the beam surface
+            core_width: Height of the core beam after flicker
+
+        Returns:
+            Mask of the solid part of the beam
+        """
+        mask = pygame.mask.Mask((surface_width, surface_height))
+        center_y = surface_height // 2
+        beginning_fade = self._beginning_fade(surface_width)
+        solid = (self.alpha * beginning_fade).astype(np.int32) > 127
+        if not solid.any():
+            return mask
+
+        # Rows covered per column by the core and, below it, the center line
+        half_core = core_width // 2 * beginning_fade
+        tops = np.floor(center_y - half_core).astype(np.int32)
+        bottoms = np.floor(center_y + half_core).astype(np.int32)
+        if surface_width > 1:
+            bottoms = np.maximum(bottoms, center_y + 1)
+        tops = np.maximum(tops, 0)
+        bottoms = np.minimum(bottoms, surface_height - 1)
+
+        # Fill runs of neighboring columns that share the same rows
+        change = np.flatnonzero(
+            (np.diff(tops) != 0) | (np.diff(bottoms) != 0) | (np.diff(solid) != 0)
+        ) + 1
+        starts = np.concatenate(([0], change)).tolist()
+        ends = np.concatenate((change, [surface_width])).tolist()
+        for start, end in zip(starts, ends):
+            if solid[start]:
+                top = int(tops[start])
+                band = pygame.mask.Mask(
+                    (end - start, int(bottoms[start]) - top + 1), fill=True
+                )
+                mask.draw(band, (start, top))
+        return mask
+
+    def _draw_body(
+        self,
+        surface_width: int,
+        surface_height: int,
+        glow_width: int,
+        core_width: int,
+        beam_alpha: int,
+    ) -> pygame.Surface:
+        """Draw the glow, core and center line of the beam.
+
+        Args:
+            surface_width: Width of the beam surface (current beam length)
+            surface_height: Height of the beam surface
+            glow_width: Height of the glow band after flicker
+            core_width: Height of the core beam after flicker
+            beam_alpha: Overall alpha the body is drawn with
+
+        Returns:
+            New surface holding the beam body
+        """
+        image = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
+        center_y = surface_height // 2
+        columns = np.arange(surface_width)
+        rows = np.arange(surface_height)
+        beginning_fade = self._beginning_fade(surface_width)
+        column_alpha = (beam_alpha * beginning_fade).astype(np.uint8)
+
+        # Write the whole body straight into the pixel arrays, indexed [x, y]
+        rgb = pygame.surfarray.pixels3d(image)
+        alpha = pygame.surfarray.pixels_alpha(image)
+
+        # Draw glow effect (wider beam with lower alpha) as a lighter red band
+        glow_alpha = int(beam_alpha * 0.4)
+        glow_top = center_y - glow_width // 2
+        glow_rows = slice(max(0, glow_top), min(surface_height, glow_top + glow_width))
+        rgb[:, glow_rows] = (255, 100, 100)
+        alpha[:, glow_rows] = (glow_alpha * beginning_fade).astype(np.uint8)[:, None]
+
+        # Draw main beam core, narrowing with the fade-in at the beginning
+        # (right side); each column spans floor(top)..floor(bottom) like a
+        # one pixel wide vertical line
+        half_core = core_width // 2 * beginning_fade
+        core_top = np.floor(center_y - half_core)
+        core_bottom = np.floor(center_y + half_core)
+        in_core = (rows >= core_top[:, None]) & (rows <= core_bottom[:, None])
+
+        # Start with bright white/red, fade to darker red
+        shade = np.maximum(50, 200 - (150 * (columns / surface_width)).astype(np.int32))
+        core_rgb = np.empty((surface_width, 1, 3), dtype=np.uint8)
+        core_rgb[:, 0, 0] = 255
+        core_rgb[:, 0, 1] = shade
+        core_rgb[:, 0, 2] = shade
+        rgb[...] = np.where(in_core[:, :, None], core_rgb, rgb)
+        alpha[...] = np.where(in_core, column_alpha[:, None], alpha)
+
+        # Draw intense center line (two rows of bright white); every column
+        # takes the alpha of the segment starting there, the last column
+        # the one before it
+        if surface_width > 1:
+            center_rows = slice(center_y, min(surface_height, center_y + 2))
+            rgb[:, center_rows] = 255
+            alpha[:, center_rows] = column_alpha[np.minimum(columns, surface_width - 2)][:, None]
+
+        # Release the pixel arrays so the surface is unlocked
+        del rgb, alpha
+
+        return image
 
     def update(self) -> None:
         """Update the laser beam's state."""
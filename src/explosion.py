@@ -1,13 +1,13 @@
 """Explosion effect for ship destruction."""
 
 import random
-from typing import List, Literal, Optional, Tuple
+from typing import List, Literal, Optional, Sequence, Tuple
 
 import pygame
 
 from src.animated_sprite import AnimatedSprite
 from src.logger import get_logger
-from src.particle import Particle, ParticleSystem
+from src.particle import ParticleSystem
 
 # Get a logger for this module
 logger = get_logger(__name__)
@@ -23,6 +23,7 @@ class Explosion(AnimatedSprite):
         explosion_type: Literal["enemy", "player"] = "enemy",
         *groups,
         particles_group: Optional[pygame.sprite.Group] = None,
+        frames: Optional[List[pygame.Surface]] = None,
     ) -> None:
         """Initialize an explosion effect at the given position.
 
@@ -32,6 +33,7 @@ class Explosion(AnimatedSprite):
             explosion_type: Type of explosion - "enemy" or "player" for different effects
             *groups: Sprite groups to add this explosion to
             particles_group: Optional group to add particles to (separate from explosion)
+            frames: Optional prebuilt animation frames to share instead of drawing new ones
         """
         # Filter out None values from groups
         valid_groups = [g for g in groups if g is not None]
@@ -40,7 +42,7 @@ class Explosion(AnimatedSprite):
         super().__init__(80, *valid_groups)
 
         # Create an explosion animation with growing circles
-        self.frames = self._create_explosion_frames(size)
+        self.frames = frames if frames is not None else self._create_explosion_frames(size)
 
         # Set initial image
         self.frame_index = 0
@@ -62,6 +64,43 @@ class Explosion(AnimatedSprite):
         else:  # player explosion
             self._create_player_explosion_particles(position)
 
+    @classmethod
+    def spawn_batch(
+        cls,
+        positions: Sequence[Tuple[int, int]],
+        size: Tuple[int, int],
+        explosion_type: Literal["enemy", "player"] = "enemy",
+        *groups,
+        particles_group: Optional[pygame.sprite.Group] = None,
+    ) -> List["Explosion"]:
+        """Create one explosion per position, sharing a single set of frames.
+
+        Args:
+            positions: Center positions (x, y) for the explosions
+            size: The size (width, height) of every explosion
+            explosion_type: Type of explosion - "enemy" or "player" for different effects
+            *groups: Sprite groups to add the explosions to
+            particles_group: Optional group to add particles to (separate from explosions)
+
+        Returns:
+            The created explosions
+        """
+        if not positions:
+            return []
+
+        frames = cls._create_explosion_frames(size)
+        explosions = [
+            cls(position, size, explosion_type, particles_group=particles_group, frames=frames)
+            for position in positions
+        ]
+
+        # Add the whole batch to each group in one call
+        for group in groups:
+            if group is not None:
+                group.add(*explosions)
+
+        return explosions
+
     def _create_enemy_explosion_particles(self, position: Tuple[int, int]) -> None:
         """Create particles for enemy explosion."""
         # Bright, fiery colors for enemy explosions
@@ -131,7 +170,8 @@ class Explosion(AnimatedSprite):
 
         logger.debug(f"Created {len(self.particles)} particles for player explosion")
 
-    def _create_explosion_frames(self, size: Tuple[int, int]) -> List[pygame.Surface]:
+    @staticmethod
+    def _create_explosion_frames(size: Tuple[int, int]) -> List[pygame.Surface]:
         """Create explosion animation frames.
 
         Args:
@@ -8,7 +8,7 @@ import random
 import math
 from collections import deque
 from enum import IntEnum
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import pygame
 
@@ -51,13 +51,16 @@ from src.enemy import (
     EnemyType8,
     get_enemy_weights,
 )
+from src.enemy_bullet import EnemyBullet
 from src.explosion import Explosion
 from src.logger import get_logger, setup_logger
 
 # Import game components
 from src.player import MAX_POWER_LEVEL, Player
 from src.power_particles import PowerParticleSystem
-from src.powerup import PowerupType
+from src.powerup import ACTIVE_POWERUP_TYPES, PowerupType
+from src.powerup_types import create_powerup, set_current_game
+from src.projectile import SCREEN_RECT, LaserBeam
 from src.sound_manager import SoundManager
 from src.particle import FlameParticle
 
@@ -71,6 +74,9 @@ logger = get_logger(__name__)
 # Define background speeds
 BG_LAYER_SPEEDS = [0.5, 1.0, 1.5, 2.0]  # Slowest to fastest
 
+# Size of the explosion spawned when an enemy is destroyed
+ENEMY_EXPLOSION_SIZE = (50, 50)
+
 # Use the event ID from config
 WAVE_TIMER_EVENT = WAVE_TIMER_EVENT_ID
 
@@ -86,6 +92,72 @@ BOSS_BLOOD_COLORS = [
     (255, 192, 203) # Pink
 ]
 
+
+def collide_groups_masked(
+    group_a: pygame.sprite.Group, group_b: pygame.sprite.Group
+) -> Dict[pygame.sprite.Sprite, List[pygame.sprite.Sprite]]:
+    """Find mask collisions between two groups with a rect broad phase.
+
+    Equivalent to pygame.sprite.groupcollide(group_a, group_b, False, False,
+    collide_mask), but each sprite in group_a is first tested against all
+    rects of group_b in a single Rect.collidelistall call, so masks are only
+    compared for pairs whose rects overlap.
+
+    Args:
+        group_a: Group whose sprites become the keys of the result
+        group_b: Group tested against each sprite of group_a
+
+    Returns:
+        Dict mapping sprites of group_a to the list of group_b sprites they hit
+    """
+    targets = group_b.sprites()
+    if not targets:
+        return {}
+    target_rects = [target.rect for target in targets]
+    collide_mask = pygame.sprite.collide_mask
+
+    hits = {}
+    for sprite in group_a.sprites():
+        candidates = sprite.rect.collidelistall(target_rects)
+        if candidates:
+            hit = [targets[i] for i in candidates if collide_mask(sprite, targets[i])]
+            if hit:
+                hits[sprite] = hit
+    return hits
+
+
+def collide_sprite_masked(
+    sprite: pygame.sprite.Sprite, group: pygame.sprite.Group, dokill: bool
+) -> List[pygame.sprite.Sprite]:
+    """Find mask collisions between one sprite and a group with a rect broad phase.
+
+    Equivalent to pygame.sprite.spritecollide(sprite, group, dokill,
+    collide_mask), but the group's rects are filtered with a single
+    Rect.collidelistall call so masks are only compared for overlapping rects.
+
+    Args:
+        sprite: Sprite tested against the group
+        group: Group of candidate sprites
+        dokill: Whether hit sprites are removed from all their groups
+
+    Returns:
+        List of group sprites that collided with the sprite
+    """
+    targets = group.sprites()
+    if not targets:
+        return []
+    candidates = sprite.rect.collidelistall([target.rect for target in targets])
+    if not candidates:
+        return []
+
+    collide_mask = pygame.sprite.collide_mask
+    hits = [targets[i] for i in candidates if collide_mask(sprite, targets[i])]
+    if dokill:
+        for target in hits:
+            target.kill()
+    return hits
+
+
 # Add a new custom explosion class for rainbow blood
 class RainbowBloodExplosion(Explosion):
     """Special rainbow blood explosion for boss hits."""
@@ -397,6 +469,9 @@ class Game:
         self.powerups = pygame.sprite.Group()  # Group for powerups
         self.notifications = pygame.sprite.Group()  # Group for text notifications
 
+        # Powerup effects act on this game's sprite groups
+        set_current_game(self)
+
         # Initialize game components
         self.player = Player(self.bullets, self.all_sprites, game_ref=self)
         # self.level_manager = LevelManager() # Not used yet
@@ -1341,11 +1416,15 @@ class Game:
                 # Update boss bullets (always update even during death anim to let them fly off)
                 self.boss_bullets.update()
                 
-                # Remove bullets that are off-screen
-                for bullet in list(self.boss_bullets):
-                    if (bullet.rect.right < 0 or bullet.rect.left > SCREEN_WIDTH or
-                        bullet.rect.bottom < 0 or bullet.rect.top > SCREEN_HEIGHT):
-                        bullet.kill()
+                # Remove bullets that are off-screen, testing every bullet
+                # rect against the screen in a single call
+                boss_bullets = self.boss_bullets.sprites()
+                on_screen = SCREEN_RECT.collidelistall([bullet.rect for bullet in boss_bullets])
+                if len(on_screen) < len(boss_bullets):
+                    on_screen = set(on_screen)
+                    for index, bullet in enumerate(boss_bullets):
+                        if index not in on_screen:
+                            bullet.kill()
 
             except Exception as e:
                 # Catch potential errors if self.boss becomes None unexpectedly during the try block
@@ -1356,8 +1435,8 @@ class Game:
 
         # Check for boss bullets hitting player
         if self.is_boss_battle and not self.player.is_invincible:
-            boss_bullet_hits = pygame.sprite.spritecollide(
-                self.player, self.boss_bullets, True, pygame.sprite.collide_mask
+            boss_bullet_hits = collide_sprite_masked(
+                self.player, self.boss_bullets, True
             )
             
             if boss_bullet_hits:
@@ -1434,9 +1513,6 @@ class Game:
         if self.is_boss_battle:
             return
 
-        # Import for type checking
-        from src.player import MAX_POWER_LEVEL
-
         # Check if we should force a specific powerup type
         if DEBUG_FORCE_POWERUP_TYPE:
             try:
@@ -1466,9 +1542,6 @@ class Game:
         x = SCREEN_WIDTH + 20  # Spawn off-screen to the right
         y = random.randint(PLAYFIELD_TOP_Y + 50, PLAYFIELD_BOTTOM_Y - 50)
 
-        # Import here to avoid circular imports
-        from src.powerup_types import create_powerup
-
         # Create the powerup using the integer index
         powerup = create_powerup(
             powerup_type_index,
@@ -1477,17 +1550,12 @@ class Game:
             self.all_sprites,
             self.powerups,
             particles_group=self.particles,
-            game_ref=self,  # Pass game reference to powerup
         )
 
         logger.info(f"Spawned powerup of type {powerup_type_name} at position ({x}, {y})")
         
     def _select_random_powerup(self):
         """Select a random powerup type, filtering out ineligible ones."""
-        # Import for type checking
-        from src.player import MAX_POWER_LEVEL
-        from src.powerup import PowerupType, ACTIVE_POWERUP_TYPES
-        
         # Filter out the last powerup type to avoid repetition
         available_types = list(ACTIVE_POWERUP_TYPES)
         if self.last_powerup_type is not None:
@@ -1522,9 +1590,6 @@ class Game:
             x: X-coordinate for spawn position
             y: Y-coordinate for spawn position
         """
-        # Import here to avoid circular imports
-        from src.powerup_types import create_powerup
-
         # Create the powerup using the integer index
         powerup = create_powerup(
             powerup_type,
@@ -1533,7 +1598,6 @@ class Game:
             self.all_sprites,
             self.powerups,
             particles_group=self.particles,
-            game_ref=self,  # Pass game reference to powerup
         )
 
         # Get the name from the Enum using the integer value
@@ -1547,9 +1611,7 @@ class Game:
         """Check for and handle all game object collisions."""
         # Collision: Player Bullets vs Enemies
         # First, get all bullet-enemy collisions without killing them yet
-        bullet_enemy_dict = pygame.sprite.groupcollide(
-            self.bullets, self.enemies, False, False, pygame.sprite.collide_mask
-        )
+        bullet_enemy_dict = collide_groups_masked(self.bullets, self.enemies)
 
         for bullet, enemies_hit in bullet_enemy_dict.items():
             for enemy in enemies_hit:
@@ -1562,7 +1624,6 @@ class Game:
                     reflection_angle = random.uniform(-30, 30)  # Add some random spread
                     
                     # Create bullet at enemy position going in player's direction
-                    from src.enemy_bullet import EnemyBullet
                     reflected_bullet = EnemyBullet(
                         enemy.rect.center, 
                         (enemy.rect.centerx - 100, enemy.rect.centery + reflection_angle),
@@ -1635,7 +1696,6 @@ class Game:
                         bullet.kill()
 
         # Special collision handling for laser beams - they don't get destroyed on hit
-        from src.projectile import LaserBeam
         for bullet in self.bullets:
             # Only process LaserBeam instances
             if isinstance(bullet, LaserBeam):
@@ -1719,10 +1779,9 @@ class Game:
                     logger.warning(f"Failed to play explosion sound: {e}") # Generic warning
 
                 # Create explosion at enemy position
-                explosion_size = (50, 50)
                 Explosion(
                     enemy.rect.center,
-                    explosion_size,
+                    ENEMY_EXPLOSION_SIZE,
                     "enemy",
                     self.explosions,
                     particles_group=self.particles,
@@ -1736,8 +1795,8 @@ class Game:
                 self._handle_game_over()
 
         # Collision: Player vs Enemy Bullets
-        bullet_hits = pygame.sprite.spritecollide(
-            self.player, self.enemy_bullets, True, pygame.sprite.collide_mask
+        bullet_hits = collide_sprite_masked(
+            self.player, self.enemy_bullets, True
         )
         if bullet_hits:
             previous_power = self.player.power_level
@@ -1758,8 +1817,8 @@ class Game:
         # Check for player bullets hitting boss
         if self.is_boss_battle and self.boss and not self.boss.is_defeated:
             try:
-                boss_hits = pygame.sprite.spritecollide(
-                    self.boss, self.bullets, True, pygame.sprite.collide_mask
+                boss_hits = collide_sprite_masked(
+                    self.boss, self.bullets, True
                 )
                 
                 # Process damage if boss was hit
@@ -1790,8 +1849,14 @@ class Game:
             except Exception as e:
                 logger.error(f"Error in boss collision detection: {e}")
 
-    def _process_enemy_destruction(self, enemy):
-        """Process an enemy that was destroyed."""
+    def _process_enemy_destruction(self, enemy, spawn_effects: bool = True):
+        """Process an enemy that was destroyed.
+
+        Args:
+            enemy: The destroyed enemy
+            spawn_effects: Whether to play the explosion sound and spawn the explosion;
+                batch callers disable this and spawn their own effects
+        """
         # More points for higher-level enemies
         if isinstance(enemy, EnemyType7):
             self.score += 400  # Reflector enemy
@@ -1810,21 +1875,21 @@ class Game:
         else:
             self.score += 50  # Basic enemy
 
-        # Play enemy explosion sound - use try/except to handle any missing sounds
-        try:
-            self.sound_manager.play("explosion2", "enemy")
-        except Exception as e:
-            logger.warning(f"Failed to play explosion sound: {e}")
-
-        # Create explosion at enemy position
-        explosion_size = (50, 50)  # Size for enemy explosion
-        Explosion(
-            enemy.rect.center,
-            explosion_size,
-            "enemy",
-            self.explosions,
-            particles_group=self.particles,
-        )
+        if spawn_effects:
+            # Play enemy explosion sound - use try/except to handle any missing sounds
+            try:
+                self.sound_manager.play("explosion2", "enemy")
+            except Exception as e:
+                logger.warning(f"Failed to play explosion sound: {e}")
+
+            # Create explosion at enemy position
+            Explosion(
+                enemy.rect.center,
+                ENEMY_EXPLOSION_SIZE,
+                "enemy",
+                self.explosions,
+                particles_group=self.particles,
+            )
         logger.debug(f"Enemy destroyed at {enemy.rect.center}")
 
         # Ensure the enemy is removed from all sprite groups
@@ -1860,17 +1925,28 @@ class Game:
         # Draw background decorations after background layers but before sprites
         self.bg_decorations.draw(self.screen)
 
-        # Draw most sprites
+        # Draw most sprites, batching plain image blits into a single
+        # blits() call and flushing the batch before any custom drawing so
+        # the layering order is unchanged
+        pending_blits = []
         for sprite in self.all_sprites:
             # Use custom draw method for reflector enemies and lightboard enemies
-            if isinstance(sprite, EnemyType7) or isinstance(sprite, EnemyType8):
+            if isinstance(sprite, (EnemyType7, EnemyType8)):
+                if pending_blits:
+                    self.screen.blits(pending_blits, doreturn=False)
+                    pending_blits.clear()
                 sprite.draw(self.screen)
             else:
-                self.screen.blit(sprite.image, sprite.rect)
+                pending_blits.append((sprite.image, sprite.rect))
 
             # Draw any enemy labels (for test mode) - use getattr to avoid linter errors
             if getattr(sprite, "label_text", None) and getattr(sprite, "label_rect", None):
+                if pending_blits:
+                    self.screen.blits(pending_blits, doreturn=False)
+                    pending_blits.clear()
                 self.screen.blit(getattr(sprite, "label_text"), getattr(sprite, "label_rect"))
+        if pending_blits:
+            self.screen.blits(pending_blits, doreturn=False)
 
         # Draw enemy bullets
         self.enemy_bullets.draw(self.screen)
@@ -2124,10 +2200,18 @@ class Game:
         except Exception as e:
             logger.warning(f"Failed to play mega blast explosion sound: {e}")
         
-        # Destroy all enemies
-        for enemy in list(self.enemies):
-            # Process each enemy's destruction to get points and effects
-            self._process_enemy_destruction(enemy)
+        # Destroy all enemies, spawning their explosions as one batch
+        enemies = list(self.enemies)
+        Explosion.spawn_batch(
+            [enemy.rect.center for enemy in enemies],
+            ENEMY_EXPLOSION_SIZE,
+            "enemy",
+            self.explosions,
+            particles_group=self.particles,
+        )
+        for enemy in enemies:
+            # Process each enemy's destruction to get points and recycle it
+            self._process_enemy_destruction(enemy, spawn_effects=False)
         
         # Clear all projectiles (player and enemy bullets)
         for bullet in list(self.bullets):
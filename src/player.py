@@ -57,6 +57,9 @@ MAX_POWER_LEVEL = 5
 POWER_BAR_SCALE = 0.3
 INVINCIBILITY_DURATION = 3000
 
+# Triple shot spread as (vertical offset, vertical velocity): center, top, bottom
+TRIPLE_SHOT_SPREAD = ((0, 0.0), (-5, -2.0), (5, 2.0))
+
 
 class Player(AnimatedSprite):
     """Represents the player-controlled spaceship."""
@@ -1353,21 +1356,12 @@ class Player(AnimatedSprite):
 
             if all_sprites_group:
                 # Create three bullets: one straight ahead, one angled up, one angled down
-                bullets = [
-                    Bullet(
-                        self.rect.right, self.rect.centery, all_sprites_group, self.bullets
-                    ),  # Center
-                    Bullet(
-                        self.rect.right, self.rect.centery - 5, all_sprites_group, self.bullets
-                    ),  # Top
-                    Bullet(
-                        self.rect.right, self.rect.centery + 5, all_sprites_group, self.bullets
-                    ),  # Bottom
-                ]
-
-                # Add vertical velocity component to the upper and lower bullets
-                bullets[1].velocity_y = -2.0  # Upward
-                bullets[2].velocity_y = 2.0  # Downward
+                right, centery = self.rect.right, self.rect.centery
+                bullets = []
+                for offset_y, velocity_y in TRIPLE_SHOT_SPREAD:
+                    bullet = Bullet(right, centery + offset_y, all_sprites_group, self.bullets)
+                    bullet.velocity_y = velocity_y
+                    bullets.append(bullet)
 
                 # Apply homing to all bullets if that powerup is also active (check state dict, use Enum name)
                 if PowerupType.HOMING_MISSILES.name in self.active_powerups_state and self.game_ref:
@@ -2,9 +2,11 @@
 
 import math
 import random
+from collections import deque
 from enum import IntEnum
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pygame
 
 # Import config variables
@@ -42,6 +44,11 @@ POWERUP_ANIMATION_SPEED_MS = 120  # Animate slightly faster than player
 POWERUP_FLOAT_SPEED = 1.0  # Base horizontal speed
 POWERUP_DURATION = 10000  # 10 seconds for temporary powerups
 POWERUP_BLINK_START = 8000  # When to start blinking (2 seconds before expiry)
+PARTICLE_POOL_SIZE = 256  # Max expired particles kept for reuse
+COLLECTION_BURST_COUNT = 30  # Particles emitted when a powerup is collected
+
+# Shared generator for vectorized particle bursts
+_rng = np.random.default_rng()
 
 # Powerup colors for different types
 POWERUP_COLORS = {
@@ -60,7 +67,16 @@ POWERUP_COLORS = {
 
 
 class PowerupParticle(pygame.sprite.Sprite):
-    """Particle effect for powerups."""
+    """Particle effect for powerups.
+
+    Expired particles are returned to a shared free list and reused by
+    acquire(), so steady-state bursts do not allocate new sprites. Glow
+    images depend only on color and size and are drawn once, then shared.
+    """
+
+    _pool: "deque[PowerupParticle]" = deque(maxlen=PARTICLE_POOL_SIZE)
+    # Glow images shared by all particles, keyed by (color, size)
+    _image_cache: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
 
     def __init__(
         self,
@@ -85,7 +101,43 @@ class PowerupParticle(pygame.sprite.Sprite):
             drag: Velocity multiplier per frame (0.98 = 2% slowdown)
             groups: Sprite groups to add to
         """
-        super().__init__(*groups)
+        super().__init__()
+        self.reset(position, velocity, color, size, lifetime, gravity, drag, *groups)
+
+    @classmethod
+    def acquire(
+        cls,
+        position: Tuple[float, float],
+        velocity: Tuple[float, float],
+        color: Tuple[int, int, int],
+        size: int,
+        lifetime: int,
+        gravity: float = 0.05,
+        drag: float = 0.98,
+        *groups,
+    ) -> "PowerupParticle":
+        """Return a recycled particle reset to the given state, or a new one.
+
+        Takes the same arguments as the constructor.
+        """
+        if cls._pool:
+            particle = cls._pool.pop()
+            particle.reset(position, velocity, color, size, lifetime, gravity, drag, *groups)
+            return particle
+        return cls(position, velocity, color, size, lifetime, gravity, drag, *groups)
+
+    def reset(
+        self,
+        position: Tuple[float, float],
+        velocity: Tuple[float, float],
+        color: Tuple[int, int, int],
+        size: int,
+        lifetime: int,
+        gravity: float,
+        drag: float,
+        *groups,
+    ) -> None:
+        """Reinitialize all particle state and add it to the given groups."""
         self.pos_x, self.pos_y = position
         self.vel_x, self.vel_y = velocity
         self.color = color
@@ -96,55 +148,73 @@ class PowerupParticle(pygame.sprite.Sprite):
         self.gravity = gravity
         self.drag = drag
 
-        # Create the image with glow effect
-        self._create_particle_image()
+        # Shared image with glow effect
+        self.image = self._get_particle_image(color, size)
 
         self.rect = self.image.get_rect(center=(int(self.pos_x), int(self.pos_y)))
-
-    def _create_particle_image(self):
+        self.add(*groups)
+
+    def release(self) -> None:
+        """Remove the particle from its groups and return it to the pool."""
+        self.kill()
+        self._pool.append(self)
+
+    @classmethod
+    def _get_particle_image(cls, color: Tuple[int, int, int], size: int) -> pygame.Surface:
+        """Return the shared glow image for a color and size, drawing it on first use."""
+        key = (color, size)
+        image = cls._image_cache.get(key)
+        if image is None:
+            image = cls._image_cache[key] = cls._create_particle_image(color, size)
+        return image
+
+    @staticmethod
+    def _create_particle_image(color: Tuple[int, int, int], size: int) -> pygame.Surface:
         """Create particle image with glow effect."""
         # Create larger surface to accommodate glow
-        glow_size = self.size * 3  # Increased glow size for better effect
+        glow_size = size * 3  # Increased glow size for better effect
         total_size = glow_size * 2
 
-        self.image = pygame.Surface((total_size, total_size), pygame.SRCALPHA)
+        image = pygame.Surface((total_size, total_size), pygame.SRCALPHA)
 
         # Inner core (full brightness)
         pygame.draw.circle(
-            self.image,
-            (*self.color, 255),  # Full alpha
+            image,
+            (*color, 255),  # Full alpha
             (total_size // 2, total_size // 2),
-            self.size // 2,
+            size // 2,
         )
 
         # Middle glow
         pygame.draw.circle(
-            self.image,
-            (*self.color, 180),  # Increased alpha for better visibility
+            image,
+            (*color, 180),  # Increased alpha for better visibility
             (total_size // 2, total_size // 2),
-            self.size,
+            size,
         )
 
         # Outer glow (very faint)
         pygame.draw.circle(
-            self.image,
-            (*self.color, 100),  # Increased alpha for outer glow
+            image,
+            (*color, 100),  # Increased alpha for outer glow
             (total_size // 2, total_size // 2),
             glow_size,
         )
 
         # Add additional highlight for sparkle effect
-        highlight_pos = (total_size // 2 - self.size // 3, total_size // 2 - self.size // 3)
-        highlight_size = max(2, self.size // 4)
+        highlight_pos = (total_size // 2 - size // 3, total_size // 2 - size // 3)
+        highlight_size = max(2, size // 4)
         pygame.draw.circle(
-            self.image, (255, 255, 255, 200), highlight_pos, highlight_size  # White highlight
+            image, (255, 255, 255, 200), highlight_pos, highlight_size  # White highlight
         )
 
+        return image
+
     def update(self) -> None:
         """Update particle position and appearance."""
         self.age += 1
         if self.age >= self.lifetime:
-            self.kill()
+            self.release()
             return
 
         # Apply drag and gravity
@@ -164,10 +234,10 @@ class PowerupParticle(pygame.sprite.Sprite):
         fade_factor = 1 - (self.age / self.lifetime)
         new_size = max(1, int(self.initial_size * fade_factor))
 
-        if new_size != self.size or self.age % 5 == 0:  # Update less frequently for performance
+        if new_size != self.size:
             self.size = new_size
-            # Recreate the image with new size
-            self._create_particle_image()
+            # Swap to the shared image for the new size
+            self.image = self._get_particle_image(self.color, new_size)
             # Keep the same center position
             old_center = self.rect.center
             self.rect = self.image.get_rect(center=old_center)
@@ -225,6 +295,8 @@ class Powerup(AnimatedSprite):
 
         # Particle effect parameters
         self.particles_group = particles_group
+        # Bound add method so spawn loops skip the attribute lookup per particle
+        self._particles_add = particles_group.add if particles_group is not None else None
         self.particle_timer = 0
         self.particle_interval = 40  # Reduced interval for more frequent particles
 
@@ -235,10 +307,12 @@ class Powerup(AnimatedSprite):
         if self.particles_group is not None:
             self._pre_spawn_initial_particles()
 
-        logger.info(f"Created {self.type_name} powerup at ({x}, {y})")
+        logger.info("Created %s powerup at (%s, %s)", self.type_name, x, y)
 
     def _pre_spawn_initial_particles(self):
         """Spawn a small burst of particles when the powerup is created."""
+        add_particle = self._particles_add
+
         # Spawn a few particles slightly ahead and behind the starting position
         for _ in range(5):  # Spawn 5 initial particles
             # Vary starting position slightly around the powerup center
@@ -254,15 +328,8 @@ class Powerup(AnimatedSprite):
             size = random.randint(2, 5)
             lifetime = random.randint(20, 40)
             
-            PowerupParticle(
-                start_pos,
-                vel,
-                self.color,
-                size,
-                lifetime,
-                0.02,
-                0.96,
-                self.particles_group,
+            add_particle(
+                PowerupParticle.acquire(start_pos, vel, self.color, size, lifetime, 0.02, 0.96)
             )
 
     def _create_special_effect_surface(self) -> pygame.Surface:
@@ -588,6 +655,7 @@ class Powerup(AnimatedSprite):
 
         # Get color for this powerup
         color = self.color
+        add_particle = self._particles_add
 
         # Create more particles (3-5) at and around the powerup
         for _ in range(random.randint(3, 5)):
@@ -608,8 +676,8 @@ class Powerup(AnimatedSprite):
             lifetime = random.randint(15, 30)  # Longer lifetime
 
             # Create particle
-            PowerupParticle(
-                position, (vel_x, vel_y), color, size, lifetime, 0.01, 0.95, self.particles_group
+            add_particle(
+                PowerupParticle.acquire(position, (vel_x, vel_y), color, size, lifetime, 0.01, 0.95)
             )
 
         # Also create a "wake" of smaller particles behind the powerup
@@ -628,8 +696,8 @@ class Powerup(AnimatedSprite):
             lifetime = random.randint(10, 20)
 
             # Create particle
-            PowerupParticle(
-                wake_pos, (vel_x, vel_y), color, size, lifetime, 0.01, 0.92, self.particles_group
+            add_particle(
+                PowerupParticle.acquire(wake_pos, (vel_x, vel_y), color, size, lifetime, 0.01, 0.92)
             )
 
     def apply_effect(self, player) -> None:
@@ -637,7 +705,7 @@ class Powerup(AnimatedSprite):
 
         This method should be overridden by subclasses.
         """
-        logger.info(f"Collected {self.type_name} powerup")
+        logger.info("Collected %s powerup", self.type_name)
 
         # Base implementation doesn't modify power level
         # Power level restoration happens only in PowerRestorePowerup
@@ -649,21 +717,19 @@ class Powerup(AnimatedSprite):
 
         # Get color for this powerup
         color = self.color
-
-        # Create a burst of particles
-        for _ in range(30):  # Increased for more dramatic effect
-            # Random angle and speed
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1.0, 4.0)  # Increased speed
-
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-
-            # Random size and lifetime
-            size = random.randint(3, 8)
-            lifetime = random.randint(40, 80)  # Longer lifetime
-
-            # Create particle
-            PowerupParticle(
-                position, (vel_x, vel_y), color, size, lifetime, 0.03, 0.96, self.particles_group
+        add_particle = self._particles_add
+
+        # Draw the random parameters for the whole burst in one batch
+        count = COLLECTION_BURST_COUNT
+        angles = _rng.uniform(0, math.pi * 2, count)
+        speeds = _rng.uniform(1.0, 4.0, count)
+        vel_xs = (np.cos(angles) * speeds).tolist()
+        vel_ys = (np.sin(angles) * speeds).tolist()
+        sizes = _rng.integers(3, 8, count, endpoint=True).tolist()
+        lifetimes = _rng.integers(40, 80, count, endpoint=True).tolist()
+
+        # Create particles
+        for vel_x, vel_y, size, lifetime in zip(vel_xs, vel_ys, sizes, lifetimes):
+            add_particle(
+                PowerupParticle.acquire(position, (vel_x, vel_y), color, size, lifetime, 0.03, 0.96)
             )
@@ -1,44 +1,59 @@
 """Implementation of powerup type behaviors."""
 
-from typing import cast, Callable, Dict, List, Optional, Type, ClassVar, Union
+import math
+import random
+import sys
+from typing import (
+    cast, Any, Dict, List, Optional, Tuple, Type, ClassVar, Union, TYPE_CHECKING
+)
 
 import pygame
 
-from config.config import PLAYER_SHOOT_DELAY, DRONE_DURATION
+from config.config import (
+    DRONE_DURATION,
+    FLAME_PARTICLE_DAMAGE,
+    FLAME_PARTICLE_LIFETIME,
+    FLAME_SPRAY_ANGLE,
+    FLAMETHROWER_DURATION,
+    PLAYER_SHOOT_DELAY,
+)
 from src.logger import get_logger
 from src.powerup import POWERUP_DURATION, Powerup, PowerupType
 from src.drone import Drone
-from typing import cast
+from src.particle import FlameParticle
+
+# Import Game type only for type checking to avoid circular import
+if TYPE_CHECKING:
+    from src.game_loop import Game
 
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# Base pickup handler, called directly to skip building a super() proxy per pickup
+_base_apply = Powerup.apply_effect
+
 # Global registry to store powerup classes by type
 POWERUP_REGISTRY: Dict[PowerupType, Type[Powerup]] = {}
 
+# Game instance whose sprite groups powerup effects act on; see set_current_game
+_CURRENT_GAME: Optional["Game"] = None
+
 # Global collection to track all active drones
 # This ensures we can find and remove all drones even if state management fails
 ACTIVE_DRONES = []
 
-def register_powerup(powerup_type: PowerupType) -> Callable:
-    """Decorator to register a powerup class with its type.
-    
+def set_current_game(game: Optional["Game"]) -> None:
+    """Set the game instance that powerup effects act on.
+
     Args:
-        powerup_type: The PowerupType enum value for this powerup
-        
-    Returns:
-        A decorator function that registers the decorated class
+        game: The running game instance, or None to clear it
     """
-    def decorator(cls):
-        POWERUP_REGISTRY[powerup_type] = cls
-        # Store the type directly on the class
-        cls.powerup_type_enum = powerup_type
-        return cls
-    return decorator
+    global _CURRENT_GAME
+    _CURRENT_GAME = game
 
 # Classification of powerups by effect type
 # For future usage when filtering/displaying powerups
-DURATION_POWERUPS = [
+DURATION_POWERUPS = frozenset({
     PowerupType.TRIPLE_SHOT,
     PowerupType.RAPID_FIRE,
     PowerupType.SHIELD,
@@ -47,163 +62,121 @@ DURATION_POWERUPS = [
     PowerupType.LASER_BEAM,
     PowerupType.DRONE,
     PowerupType.FLAMETHROWER,
-]
+})
 
-CHARGE_POWERUPS = [
+CHARGE_POWERUPS = frozenset({
     PowerupType.SCATTER_BOMB,
-]
+})
 
-INSTANT_POWERUPS = [
+INSTANT_POWERUPS = frozenset({
     PowerupType.POWER_RESTORE,
     PowerupType.MEGA_BLAST,
-]
+})
 
 # Create a base class for our registry-compatible powerups
 class PowerupBase(Powerup):
     """Base class for all powerups that use the registry system."""
     
-    # This will be set by the decorator
+    # These are set by __init_subclass__ from the powerup_type class keyword
     powerup_type_enum: ClassVar[PowerupType]
+    powerup_name: ClassVar[str]
+
+    # Arguments for player.add_powerup: (duration_ms, charges, extra_state)
+    _APPLY_SPEC: ClassVar[Tuple[Optional[int], Optional[int], Optional[Dict[str, Any]]]] = (
+        POWERUP_DURATION,
+        None,
+        None,
+    )
     
+    def __init_subclass__(cls, powerup_type: Optional[PowerupType] = None, **kwargs) -> None:
+        """Register a subclass declared with a powerup_type class keyword.
+
+        Args:
+            powerup_type: The PowerupType enum value for this powerup
+        """
+        super().__init_subclass__(**kwargs)
+        if powerup_type is None:
+            return
+        POWERUP_REGISTRY[powerup_type] = cls
+        # Store the type directly on the class
+        cls.powerup_type_enum = powerup_type
+        # Interned state key so active_powerups_state lookups compare by identity
+        cls.powerup_name = sys.intern(powerup_type.name)
+
     def __init__(
         self,
         x: float,
         y: float,
-        *groups,
+        group: Optional[pygame.sprite.Group] = None,
+        *extra_groups,
         particles_group: Optional[pygame.sprite.Group] = None,
-        game_ref=None,
     ) -> None:
-        """Initialize the powerup with the type stored in the class attribute."""
-        # Pass the type from the class attribute to the Powerup constructor
-        super().__init__(self.__class__.powerup_type_enum, x, y, *groups, particles_group=particles_group)
-        self.game_ref = game_ref
-    
-    @classmethod
-    def create(
-        cls,
-        x: float,
-        y: float,
-        *groups,
-        particles_group: Optional[pygame.sprite.Group] = None,
-        game_ref=None,
-    ) -> 'PowerupBase':
-        """Class method to create a powerup instance without type confusion."""
-        return cls(x, y, *groups, particles_group=particles_group, game_ref=game_ref)
-
-@register_powerup(PowerupType.TRIPLE_SHOT)
-class TripleShotPowerup(PowerupBase):
-    """Triple shot powerup - player fires 3 bullets at once."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.TRIPLE_SHOT
-
-    def apply_effect(self, player) -> None:
-        """Apply the triple shot effect to the player."""
-        super().apply_effect(player)  # Call base implementation
-
-        # Use the centralized state management method
-        player.add_powerup(
-            powerup_name=PowerupType.TRIPLE_SHOT.name,
-            powerup_idx=PowerupType.TRIPLE_SHOT.value,
-            duration_ms=POWERUP_DURATION,
-        )
-
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
+        """Initialize the powerup with the type stored in the class attribute.
 
-        logger.info("Triple Shot activated for 10 seconds")
-
-@register_powerup(PowerupType.RAPID_FIRE)
-class RapidFirePowerup(PowerupBase):
-    """Rapid fire powerup - player shoots more frequently."""
+        The first sprite group is taken as a named parameter so the common
+        zero- and one-group spawns avoid repacking a varargs tuple.
+        """
+        # Pass the type from the class attribute to the Powerup constructor
+        if group is None:
+            super().__init__(type(self).powerup_type_enum, x, y, particles_group=particles_group)
+        else:
+            super().__init__(
+                type(self).powerup_type_enum,
+                x,
+                y,
+                group,
+                *extra_groups,
+                particles_group=particles_group,
+            )
     
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.RAPID_FIRE
-
     def apply_effect(self, player) -> None:
-        """Apply the rapid fire effect to the player."""
-        super().apply_effect(player)  # Call base implementation
+        """Register this powerup in the player's active state using _APPLY_SPEC."""
+        _base_apply(self, player)
 
-        # Calculate the rapid fire delay
-        # Use PLAYER_SHOOT_DELAY directly from config
-        rapid_fire_delay = PLAYER_SHOOT_DELAY // 3
+        duration_ms, charges, extra_state = self._APPLY_SPEC
 
         # Use the centralized state management method
         player.add_powerup(
-            powerup_name=PowerupType.RAPID_FIRE.name,
-            powerup_idx=PowerupType.RAPID_FIRE.value,
-            duration_ms=POWERUP_DURATION,
-            extra_state={"delay": rapid_fire_delay},  # Store the calculated delay
+            powerup_name=self.powerup_name,
+            powerup_idx=self.powerup_type,
+            duration_ms=duration_ms,
+            charges=charges,
+            extra_state=extra_state,
         )
 
         # Create collection effect
         self._create_collection_effect(player.rect.center)
 
-        logger.info("Rapid Fire activated for 10 seconds")
+        logger.info("%s activated", self.type_name)
 
-@register_powerup(PowerupType.SHIELD)
-class ShieldPowerup(PowerupBase):
-    """Shield powerup - temporary invulnerability."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.SHIELD
+    def _share_game_ref(self, player) -> None:
+        """Give the player the current game reference if it has none."""
+        if _CURRENT_GAME and getattr(player, "game_ref", None) is None:
+            player.game_ref = _CURRENT_GAME
+            logger.info("Set game reference on player from %s powerup", self.type_name)
 
-    def apply_effect(self, player) -> None:
-        """Apply the shield effect to the player."""
-        super().apply_effect(player)  # Call base implementation
+class TripleShotPowerup(PowerupBase, powerup_type=PowerupType.TRIPLE_SHOT):
+    """Triple shot powerup - player fires 3 bullets at once."""
 
-        # Use the centralized state management method
-        player.add_powerup(
-            powerup_name=PowerupType.SHIELD.name,
-            powerup_idx=PowerupType.SHIELD.value,
-            duration_ms=POWERUP_DURATION,
-        )
+class RapidFirePowerup(PowerupBase, powerup_type=PowerupType.RAPID_FIRE):
+    """Rapid fire powerup - player shoots more frequently."""
 
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
+    # Store the reduced shot delay alongside the timer
+    _APPLY_SPEC = (POWERUP_DURATION, None, {"delay": PLAYER_SHOOT_DELAY // 3})
 
-        # Create shield visual
-        # This could be implemented in the player's draw method
-        # For now we just log that we got it
-        logger.info("Shield activated for 10 seconds")
+class ShieldPowerup(PowerupBase, powerup_type=PowerupType.SHIELD):
+    """Shield powerup - temporary invulnerability."""
 
-@register_powerup(PowerupType.HOMING_MISSILES)
-class HomingMissilesPowerup(PowerupBase):
+class HomingMissilesPowerup(PowerupBase, powerup_type=PowerupType.HOMING_MISSILES):
     """Homing missiles powerup - bullets track nearest enemy."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.HOMING_MISSILES
 
     def apply_effect(self, player) -> None:
         """Apply the homing missiles effect to the player."""
-        super().apply_effect(player)  # Call base implementation
-
-        # Set the game reference if one is available and player doesn't have one
-        if self.game_ref and not hasattr(player, "game_ref") or not player.game_ref:
-            player.game_ref = self.game_ref
-            logger.info("Set game reference on player from homing missile powerup")
+        self._share_game_ref(player)
+        super().apply_effect(player)
 
-        # Use the centralized state management method
-        player.add_powerup(
-            powerup_name=PowerupType.HOMING_MISSILES.name,
-            powerup_idx=PowerupType.HOMING_MISSILES.value,
-            duration_ms=POWERUP_DURATION,
-            # No extra state needed; homing logic checks if key exists in dict
-        )
-
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
-
-        logger.info("Homing Missiles activated for 10 seconds")
-        # Note: The actual homing behavior would be implemented in the Bullet class
-        # or a new HomingMissile class, and player.update would check for expiry
-
-@register_powerup(PowerupType.POWER_RESTORE)
-class PowerRestorePowerup(PowerupBase):
+class PowerRestorePowerup(PowerupBase, powerup_type=PowerupType.POWER_RESTORE):
     """Power restore powerup - instantly restores player's power to max."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.POWER_RESTORE
 
     def apply_effect(self, player) -> None:
         """Apply the power restore effect to the player."""
@@ -225,72 +198,27 @@ class PowerRestorePowerup(PowerupBase):
         self._create_collection_effect(player.rect.center)
 
         # Log the power increase
-        logger.info(f"Power fully restored from {old_power} to {player.power_level}")
+        logger.info("Power fully restored from %s to %s", old_power, player.power_level)
 
         # Note: Power Restore does not add itself to the active_powerups_state
         # as it's an instant effect with no duration or charges.
 
-@register_powerup(PowerupType.SCATTER_BOMB)
-class ScatterBombPowerup(PowerupBase):
+class ScatterBombPowerup(PowerupBase, powerup_type=PowerupType.SCATTER_BOMB):
     """Scatter bomb powerup - releases burst of projectiles in all directions."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.SCATTER_BOMB
-
-    def apply_effect(self, player) -> None:
-        """Apply the scatter bomb effect to the player."""
-        super().apply_effect(player)  # Call base implementation
-
-        # Use the centralized state management method
-        # Add 3 charges initially, subsequent pickups will add more via add_powerup logic
-        player.add_powerup(
-            powerup_name=PowerupType.SCATTER_BOMB.name,
-            powerup_idx=PowerupType.SCATTER_BOMB.value,
-            charges=3,
-        )
-
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
 
-        # Note: The actual scatter bombing would be handled in the player's update
-        # or a new method triggered by a key press
+    # Add 3 charges initially, subsequent pickups will add more via add_powerup logic
+    _APPLY_SPEC = (POWERUP_DURATION, 3, None)
 
-@register_powerup(PowerupType.TIME_WARP)
-class TimeWarpPowerup(PowerupBase):
+class TimeWarpPowerup(PowerupBase, powerup_type=PowerupType.TIME_WARP):
     """Time warp powerup - slows down enemies and enemy bullets."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.TIME_WARP
 
     def apply_effect(self, player) -> None:
         """Apply the time warp effect."""
-        super().apply_effect(player)  # Call base implementation
-
-        # Set the game reference if one is available and player doesn't have one
-        if self.game_ref and not hasattr(player, "game_ref") or not player.game_ref:
-            player.game_ref = self.game_ref
-            logger.info("Set game reference on player from time warp powerup")
-
-        # Use the centralized state management method
-        player.add_powerup(
-            powerup_name=PowerupType.TIME_WARP.name,
-            powerup_idx=PowerupType.TIME_WARP.value,
-            duration_ms=POWERUP_DURATION,
-        )
+        self._share_game_ref(player)
+        super().apply_effect(player)
 
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
-
-        logger.info("Time Warp activated for 10 seconds")
-        # Note: The actual time warping would be implemented in the
-        # game's update method, slowing down enemies and bullets
-
-@register_powerup(PowerupType.MEGA_BLAST)
-class MegaBlastPowerup(PowerupBase):
+class MegaBlastPowerup(PowerupBase, powerup_type=PowerupType.MEGA_BLAST):
     """Mega blast powerup - screen-clearing explosion."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.MEGA_BLAST
 
     def apply_effect(self, player) -> None:
         """Apply the mega blast effect.
@@ -301,18 +229,22 @@ class MegaBlastPowerup(PowerupBase):
         # Log the effect directly instead
         logger.info("Mega Blast activated")
 
+        # Blast and particle burst share the player's position
+        center = player.rect.center
+
         # Create collection effect
-        self._create_collection_effect(player.rect.center)
+        self._create_collection_effect(center)
 
         # Create a mega blast effect if the game reference is available
-        if self.game_ref:
+        game = _CURRENT_GAME
+        if game:
             # Try to access the mega blast method
-            if hasattr(self.game_ref, "_create_mega_blast"):
+            if hasattr(game, "_create_mega_blast"):
                 try:
                     # Call the mega blast method
-                    self.game_ref._create_mega_blast(player.rect.center)
+                    game._create_mega_blast(center)
                 except Exception as e:
-                    logger.error(f"Error creating mega blast: {e}")
+                    logger.error("Error creating mega blast: %s", e)
             else:
                 logger.warning("Game instance does not have _create_mega_blast method")
         else:
@@ -321,52 +253,32 @@ class MegaBlastPowerup(PowerupBase):
         # Note: Mega Blast does not add itself to the active_powerups_state
         # as it's an instant effect with no duration or charges.
 
-@register_powerup(PowerupType.LASER_BEAM)
-class LaserBeamPowerup(PowerupBase):
+class LaserBeamPowerup(PowerupBase, powerup_type=PowerupType.LASER_BEAM):
     """Laser beam powerup - player fires a powerful growing green laser beam."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.LASER_BEAM
 
-    def apply_effect(self, player) -> None:
-        """Apply the laser beam effect to the player."""
-        super().apply_effect(player)  # Call base implementation
-
-        # Use the centralized state management method
-        player.add_powerup(
-            powerup_name=PowerupType.LASER_BEAM.name,
-            powerup_idx=PowerupType.LASER_BEAM.value,
-            duration_ms=POWERUP_DURATION,
-            charges=5,  # Add 5 laser beam charges
-        )
-
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
+    # Timed powerup that also grants 5 laser beam charges
+    _APPLY_SPEC = (POWERUP_DURATION, 5, None)
 
-        logger.info("Laser Beam activated for 10 seconds with 5 charges")
-
-@register_powerup(PowerupType.DRONE)
-class DronePowerup(PowerupBase):
+class DronePowerup(PowerupBase, powerup_type=PowerupType.DRONE):
     """Drone powerup - spawns a drone that orbits the player and shoots enemies."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.DRONE
 
     def apply_effect(self, player) -> None:
         """Apply the drone effect to the player."""
-        super().apply_effect(player)  # Call base implementation
+        # The drone state is built per pickup, so skip the _APPLY_SPEC registration
+        _base_apply(self, player)
 
         # Check if we have a valid game reference
-        if not self.game_ref:
+        game = _CURRENT_GAME
+        if not game:
             logger.warning("No game reference available, drone powerup might not work correctly")
             return
 
         # Create a drone instance
         drone = Drone(
             player, 
-            self.game_ref.enemies, 
+            game.enemies, 
             player.bullets,
-            self.game_ref.all_sprites
+            game.all_sprites
         )
         
         # Keep track of drone globally
@@ -375,7 +287,7 @@ class DronePowerup(PowerupBase):
         
         # Use the centralized state management method
         player.add_powerup(
-            powerup_name=PowerupType.DRONE.name,
+            powerup_name=self.powerup_name,
             powerup_idx=PowerupType.DRONE.value,
             duration_ms=DRONE_DURATION,
             extra_state={"drone_instance": drone},
@@ -384,41 +296,23 @@ class DronePowerup(PowerupBase):
         # Create collection effect
         self._create_collection_effect(player.rect.center)
 
-        logger.info(f"Drone activated for 15 seconds")
+        logger.info("Drone activated for 15 seconds")
 
-@register_powerup(PowerupType.FLAMETHROWER)
-class FlamethrowerPowerup(PowerupBase):
+class FlamethrowerPowerup(PowerupBase, powerup_type=PowerupType.FLAMETHROWER):
     """Flamethrower powerup - player sprays flames up and down in a fiery effect."""
-    
-    # Explicitly define as class variable with correct type
-    powerup_type_enum: ClassVar[PowerupType] = PowerupType.FLAMETHROWER
+
+    _APPLY_SPEC = (FLAMETHROWER_DURATION, None, None)
 
     def apply_effect(self, player) -> None:
         """Apply the flamethrower effect to the player."""
-        super().apply_effect(player)  # Call base implementation
+        super().apply_effect(player)  # Register state and create collection effect
 
-        # Import required modules and constants
-        from config.config import FLAMETHROWER_DURATION, FLAME_PARTICLE_DAMAGE, FLAME_PARTICLE_LIFETIME, FLAME_SPRAY_ANGLE
-        from src.particle import FlameParticle
-        import random
-        import math
-
-        # Use the centralized state management method
-        player.add_powerup(
-            powerup_name=PowerupType.FLAMETHROWER.name,
-            powerup_idx=PowerupType.FLAMETHROWER.value,
-            duration_ms=FLAMETHROWER_DURATION,
-        )
-
-        # Create collection effect
-        self._create_collection_effect(player.rect.center)
-        
         # Reset flame timer to allow future particle creation
         if hasattr(player, 'flame_timer'):
             player.flame_timer = 0
         
         # Get necessary references
-        game = self.game_ref
+        game = _CURRENT_GAME
         if not game or not hasattr(game, 'all_sprites'):
             logger.warning("Cannot create immediate flame particles: no game reference or sprite groups")
         else:
@@ -428,8 +322,9 @@ class FlamethrowerPowerup(PowerupBase):
             
             if all_sprites_group and bullets_group:
                 # Base position slightly in front of player
-                base_x = player.rect.right
-                base_y = player.rect.centery
+                player_rect = player.rect
+                base_x = player_rect.right
+                base_y = player_rect.centery
                 
                 # Create an initial burst of flames (more than usual for dramatic effect)
                 for _ in range(10):  # Create 10 particles for a big initial burst
@@ -466,19 +361,29 @@ class FlamethrowerPowerup(PowerupBase):
                 
                 logger.info("Created immediate flame particles on powerup collection")
         
-        # 3. Activate sound immediately
+        # Start the looping flame sound; _shoot_flamethrower only spawns particles
         if hasattr(player, '_manage_flamethrower_sound'):
             player._manage_flamethrower_sound(True)
         
-        # Also try the player's method (as a backup)
+        # Fire the first regular flame volley without waiting for the cooldown
         if hasattr(player, '_shoot_flamethrower'):
             try:
                 player._shoot_flamethrower(force=True)
-            except Exception as e:
-                logger.warning(f"Failed to call player's _shoot_flamethrower: {e}")
+            except AttributeError as e:
+                logger.warning("Failed to call player's _shoot_flamethrower: %s", e)
 
         # Log activation
-        logger.info(f"Flamethrower activated for {FLAMETHROWER_DURATION/1000} seconds with immediate effect")
+        logger.info(
+            "Flamethrower activated for %s seconds with immediate effect",
+            FLAMETHROWER_DURATION / 1000,
+        )
+
+# Registered classes indexed by PowerupType value for direct lookup on spawn;
+# this relies on the enum values running 0, 1, 2, ... in declaration order
+assert [t.value for t in PowerupType] == list(range(len(PowerupType)))
+_POWERUP_CLASSES: Tuple[Type[PowerupBase], ...] = tuple(
+    cast(Type[PowerupBase], POWERUP_REGISTRY[powerup_type]) for powerup_type in PowerupType
+)
 
 # Factory function to create a powerup of a specific type
 def create_powerup(
@@ -487,7 +392,6 @@ def create_powerup(
     y: float,
     *groups,
     particles_group: Optional[pygame.sprite.Group] = None,
-    game_ref=None,
 ) -> Powerup:
     """Create a powerup of the specified type.
 
@@ -497,44 +401,24 @@ def create_powerup(
         y: Initial y position
         groups: Sprite groups to add to
         particles_group: Optional group for particle effects
-        game_ref: Reference to the game instance
 
     Returns:
         A new powerup instance of the appropriate type
     """
-    # Convert int to PowerupType if needed
-    if isinstance(powerup_type, int):
-        try:
-            powerup_enum_member = PowerupType(powerup_type)
-        except ValueError:
-            logger.error(f"Invalid powerup type integer: {powerup_type}")
-            # Default to Triple Shot as a fallback
-            powerup_enum_member = PowerupType.TRIPLE_SHOT
-    else:
-        # Already a PowerupType
-        powerup_enum_member = powerup_type
-
-    # Get the correct class from the registry using the Enum member
-    powerup_class = POWERUP_REGISTRY.get(powerup_enum_member)
-
-    if not powerup_class:
-        logger.error(f"No class registered for powerup type: {powerup_enum_member.name}")
-        # Fallback to Triple Shot class
-        powerup_class = POWERUP_REGISTRY[PowerupType.TRIPLE_SHOT]
-
-    # Use a type cast to silence the linter error
-
-    
-    # Create powerup instance
-    powerup = cast(Type[PowerupBase], powerup_class).create(
+    # PowerupType is an IntEnum, so members and plain ints index the same way;
+    # anything out of range falls back to Triple Shot
+    in_range = 0 <= powerup_type < len(_POWERUP_CLASSES)
+    powerup_class = _POWERUP_CLASSES[powerup_type] if in_range else TripleShotPowerup
+    if not in_range:
+        logger.error("Invalid powerup type: %s", powerup_type)
+
+    # Construct directly so the groups tuple is unpacked only once
+    return powerup_class(
         x,
         y,
         *groups,
         particles_group=particles_group,
-        game_ref=game_ref,
     )
-    
-    return powerup
 
 # Helper function to get all registered powerup types
 def get_all_powerup_types() -> List[PowerupType]:
@@ -553,14 +437,14 @@ def get_powerups_by_category(category: str) -> List[PowerupType]:
         category: The category to filter by ('duration', 'charge', or 'instant')
         
     Returns:
-        List of PowerupType enum values in the requested category
+        List of PowerupType enum values in the requested category, ordered by value
     """
     if category == 'duration':
-        return DURATION_POWERUPS
+        return sorted(DURATION_POWERUPS)
     elif category == 'charge':
-        return CHARGE_POWERUPS
+        return sorted(CHARGE_POWERUPS)
     elif category == 'instant':
-        return INSTANT_POWERUPS
+        return sorted(INSTANT_POWERUPS)
     else:
-        logger.warning(f"Unknown powerup category: {category}")
+        logger.warning("Unknown powerup category: %s", category)
         return []
@@ -2,54 +2,67 @@
 
 import math
 import random
-from typing import Optional, Tuple
+from typing import ClassVar, Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
-from config.config import BULLET_SIZE, BULLET_SPEED
+from config.config import BULLET_SIZE, BULLET_SPEED, SCREEN_HEIGHT, SCREEN_WIDTH
 from src.logger import get_logger
 
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# Logical playfield bounds; the display is created SCALED at this size
+SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+# Yellow-orange colors used for scatter bomb projectiles
+SCATTER_COLORS = ((255, 100, 0), (255, 200, 0), (255, 50, 0), (255, 150, 50))
+# Number of frames over which scatter projectiles fade out
+SCATTER_FADE_FRAMES = 20
+
+# Number of precomputed sizes a homing missile cycles through as it pulses
+MISSILE_PULSE_PHASES = 8
+
+# Shared generator for batched particle randomness
+_rng = np.random.default_rng()
+
+# Record layout of a single laser beam particle; every field is float32 so
+# the records can also be viewed as a plain 2D table
+LASER_PARTICLE_DTYPE = np.dtype(
+    [
+        ("x", np.float32),
+        ("y", np.float32),
+        ("size", np.float32),
+        ("speed", np.float32),
+        ("drift", np.float32),  # Slow vertical drift
+        ("life", np.float32),
+        ("phase", np.float32),  # Pulse phase of the oscillation
+        ("amp", np.float32),  # Oscillation amplitude
+    ]
+)
+
 
 class Bullet(pygame.sprite.Sprite):
     """Basic projectile fired by the player."""
 
+    # Shared, read-only image and mask built on first use
+    _IMAGE: ClassVar[Optional[pygame.Surface]] = None
+    _MASK: ClassVar[Optional[pygame.mask.Mask]] = None
+    # Pulsing homing missile frames keyed by image size
+    _MISSILE_FRAMES: ClassVar[Dict[int, Tuple[pygame.Surface, pygame.mask.Mask]]] = {}
+
     def __init__(self, x: int, y: int, *groups) -> None:
         """Initialize a bullet at position (x, y)."""
         super().__init__(*groups)
 
-        # Create bullet surface
-        self.image = pygame.Surface(BULLET_SIZE, pygame.SRCALPHA)
-        # Draw the bullet as a white circle
-        pygame.draw.circle(
-            self.image,
-            (240, 240, 240),  # Near-white color
-            (BULLET_SIZE[0] // 2, BULLET_SIZE[1] // 2),
-            BULLET_SIZE[0] // 2,
-        )
-
-        # Add a subtle glow effect
-        glow_size = (BULLET_SIZE[0] + 4, BULLET_SIZE[1] + 4)
-        glow_surface = pygame.Surface(glow_size, pygame.SRCALPHA)
-        pygame.draw.circle(
-            glow_surface,
-            (240, 240, 255, 128),  # Semi-transparent white/blue
-            (glow_size[0] // 2, glow_size[1] // 2),
-            glow_size[0] // 2,
-        )
-
-        # Create the final image with glow
-        final_size = (BULLET_SIZE[0] + 4, BULLET_SIZE[1] + 4)
-        final_image = pygame.Surface(final_size, pygame.SRCALPHA)
-        final_image.blit(glow_surface, (0, 0))
-        final_image.blit(self.image, (2, 2))  # Center the bullet on the glow
-        self.image = final_image
+        if Bullet._IMAGE is None:
+            Bullet._build_image()
 
-        # Set up rect and mask
+        # Share the pre-rendered image and mask between all bullets
+        self.image = Bullet._IMAGE
+        self.mask = Bullet._MASK
         self.rect = self.image.get_rect(center=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
 
         # Set up velocity
         self.velocity_x = BULLET_SPEED
@@ -69,6 +82,42 @@ class Bullet(pygame.sprite.Sprite):
         self.pulse_time: float = 0.0
         self.pulse_speed: float = 0.2 # Set default speed here
         self.original_size: Optional[int] = None
+        self._pulse_frames: List[Tuple[pygame.Surface, pygame.mask.Mask]] = []
+
+    @classmethod
+    def _build_image(cls) -> None:
+        """Render the bullet and glow composite once for all bullets."""
+        # Draw the bullet as a white circle
+        core = pygame.Surface(BULLET_SIZE, pygame.SRCALPHA)
+        pygame.draw.circle(
+            core,
+            (240, 240, 240),  # Near-white color
+            (BULLET_SIZE[0] // 2, BULLET_SIZE[1] // 2),
+            BULLET_SIZE[0] // 2,
+        )
+
+        # Add a subtle glow effect
+        glow_size = (BULLET_SIZE[0] + 4, BULLET_SIZE[1] + 4)
+        glow_surface = pygame.Surface(glow_size, pygame.SRCALPHA)
+        pygame.draw.circle(
+            glow_surface,
+            (240, 240, 255, 128),  # Semi-transparent white/blue
+            (glow_size[0] // 2, glow_size[1] // 2),
+            glow_size[0] // 2,
+        )
+
+        # Create the final image with the bullet centered on the glow
+        final_image = pygame.Surface(glow_size, pygame.SRCALPHA)
+        final_image.blit(glow_surface, (0, 0))
+        final_image.blit(core, (2, 2))
+
+        # The glow needs per-pixel alpha, but matching the display's pixel
+        # format keeps every bullet blit on the fast path
+        if pygame.display.get_surface() is not None:
+            final_image = final_image.convert_alpha()
+
+        cls._IMAGE = final_image
+        cls._MASK = pygame.mask.from_surface(final_image)
 
     def update(self) -> None:
         """Update the bullet's position."""
@@ -80,12 +129,11 @@ class Bullet(pygame.sprite.Sprite):
             self.pos_x += self.velocity_x
             self.pos_y += self.velocity_y
 
-        # Update rect based on float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect based on float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
-        # Remove bullet if it goes off-screen
-        if self.rect.left > pygame.display.get_surface().get_width():
+        # Remove bullet if it goes off-screen; pos_x is the rect's left edge
+        if self.pos_x > SCREEN_WIDTH:
             self.kill()
 
     def _update_homing(self) -> None:
@@ -109,78 +157,90 @@ class Bullet(pygame.sprite.Sprite):
             dx /= distance
             dy /= distance
 
-            # Calculate velocity
-            angle = math.atan2(dy, dx)
-
-            # Smoothly adjust direction
-            current_angle = math.atan2(self.velocity_y, self.velocity_x)
+            # Current heading as a unit vector (default to facing right)
+            speed = math.hypot(self.velocity_x, self.velocity_y)
+            if speed > 0:
+                ux = self.velocity_x / speed
+                uy = self.velocity_y / speed
+            else:
+                ux, uy = 1.0, 0.0
 
-            # Calculate angle difference (handle wrap-around)
-            angle_diff = ((angle - current_angle + math.pi) % (2 * math.pi)) - math.pi
-
-            # Update angle based on turn rate - increase turn rate when closer to target for better tracking
+            # Update direction based on turn rate - increase turn rate when closer to target for better tracking
             turn_rate_adjusted = self.turn_rate
             if distance < 200:
                 # Increase turn rate when getting closer to target
                 turn_rate_adjusted = self.turn_rate * (1.5 + (200 - distance) / 100)
 
-            new_angle = current_angle + angle_diff * turn_rate_adjusted
+            # If the target is behind, steer toward the perpendicular on the
+            # target's side so the blend below never collapses
+            if ux * dx + uy * dy < 0:
+                if ux * dy - uy * dx >= 0:
+                    dx, dy = -uy, ux
+                else:
+                    dx, dy = uy, -ux
+
+            # Smoothly adjust direction by blending the heading toward the
+            # target direction instead of converting to and from angles
+            new_x = ux + (dx - ux) * turn_rate_adjusted
+            new_y = uy + (dy - uy) * turn_rate_adjusted
+            new_len = math.hypot(new_x, new_y)
 
             # Update velocity components
-            self.velocity_x = math.cos(new_angle) * self.homing_speed
-            self.velocity_y = math.sin(new_angle) * self.homing_speed
+            if new_len > 0:
+                self.velocity_x = new_x / new_len * self.homing_speed
+                self.velocity_y = new_y / new_len * self.homing_speed
 
         # Apply velocity
         self.pos_x += self.velocity_x
         self.pos_y += self.velocity_y
 
-        # Create a trail effect if homing
+        # Create a pulsing effect by stepping through the frames prepared
+        # in make_homing, one per phase of the pulse cycle
         self.pulse_time += self.pulse_speed
+        phase = int(self.pulse_time / (2 * math.pi) * MISSILE_PULSE_PHASES) % MISSILE_PULSE_PHASES
+        frame = self._pulse_frames[phase]
+        if frame[0] is not self.image:
+            old_center = self.rect.center # Store center before resize
+            self.image, self.mask = frame
+            self.rect = self.image.get_rect(center=old_center)
 
-        # Update the appearance of the missile to create a pulsing effect
-        if random.random() < 0.2:
-            # Ensure original_size is set before using it
-            if self.original_size is None:
-                self.original_size = self.rect.width # Default to current width if not set
+    @classmethod
+    def _get_missile_frame(cls, size: int) -> Tuple[pygame.Surface, pygame.mask.Mask]:
+        """Return the cached homing missile image and mask for a size.
 
-            # Use a default value if original_size is still None (e.g., rect.width was invalid)
-            size = self.original_size if self.original_size is not None else 1
-            pulse_factor = 1.0 + 0.1 * math.sin(self.pulse_time)
-            new_size = int(max(1.0, size * pulse_factor))
+        The pulse only ever produces a handful of distinct sizes, so each
+        one is drawn once and shared by all missiles.
 
-            # Re-create the image with the pulsed size
-            old_center = self.rect.center # Store center before resize
-            self.image = pygame.Surface((new_size, new_size), pygame.SRCALPHA)
+        Args:
+            size: Width and height of the missile image in pixels
+
+        Returns:
+            Tuple of the missile surface and its collision mask
+        """
+        frame = cls._MISSILE_FRAMES.get(size)
+        if frame is None:
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
 
-            # Redraw the missile shape (should match make_homing visually)
+            # Draw the missile shape (should match make_homing visually)
             points = [
-                (new_size - 2, new_size // 2),  # Tip
-                (0, new_size // 4),  # Bottom left
-                (0, 3 * new_size // 4),  # Top left
+                (size - 2, size // 2),  # Tip
+                (0, size // 4),  # Bottom left
+                (0, 3 * size // 4),  # Top left
             ]
-            pygame.draw.polygon(self.image, (255, 50, 50), points)  # Bright red
+            pygame.draw.polygon(image, (255, 50, 50), points)  # Bright red
             pygame.draw.circle(
-                self.image, (255, 255, 0), (new_size - 5, new_size // 2), new_size // 4
+                image, (255, 255, 0), (size - 5, size // 2), size // 4
             ) # Yellow tip
             glow_points = [
-                (0, new_size // 3), (0, 2 * new_size // 3), (-new_size // 1.5, new_size // 2)
+                (0, size // 3), (0, 2 * size // 3), (-size // 1.5, size // 2)
             ]
             pygame.draw.polygon(
-                self.image, (255, 200, 0, 230), glow_points
+                image, (255, 200, 0, 230), glow_points
             ) # Engine glow
 
-            # Update rect and mask
-            self.rect = self.image.get_rect(center=old_center)
-            self.mask = pygame.mask.from_surface(self.image)
-
-        # Ensure original_size is set even if not pulsing this frame
-        elif self.original_size is None:
-            self.original_size = self.rect.width
-
-        # Log that a homing missile was created
-        logger.info(
-            f"Created homing missile targeting enemy at {self.target.rect.center if self.target else 'NO_TARGET'}"
-        )
+            frame = (image, pygame.mask.from_surface(image))
+            cls._MISSILE_FRAMES[size] = frame
+        return frame
 
     def make_homing(self, target) -> None:
         """Convert this bullet to a homing missile."""
@@ -189,14 +249,32 @@ class Bullet(pygame.sprite.Sprite):
         self.pulse_time = 0.0
         self.original_size = self.rect.width # Store the initial homing size
 
-        # Update rect and mask
+        # Switch to the shared missile frame instead of rebuilding the mask
+        self.image, self.mask = self._get_missile_frame(self.original_size)
         self.rect = self.image.get_rect(center=self.rect.center)
-        self.mask = pygame.mask.from_surface(self.image)
+
+        # Look up the shared frame for each pulse phase once, so the homing
+        # update only indexes into this list
+        pulse_factors = [
+            1.0 + 0.1 * math.sin(2 * math.pi * phase / MISSILE_PULSE_PHASES)
+            for phase in range(MISSILE_PULSE_PHASES)
+        ]
+        self._pulse_frames = [
+            self._get_missile_frame(int(max(1.0, self.original_size * factor)))
+            for factor in pulse_factors
+        ]
+
+        logger.debug(f"Created homing missile targeting enemy at {target.rect.center}")
 
 
 class ScatterProjectile(pygame.sprite.Sprite):
     """Projectile that moves in a specified direction."""
 
+    # Shared (image, mask) pairs, one per scatter color, built on first use
+    _IMAGES: ClassVar[List[Tuple[pygame.Surface, pygame.mask.Mask]]] = []
+    # Faded copies of each image, indexed by color and remaining lifetime
+    _FADE_FRAMES: ClassVar[List[List[pygame.Surface]]] = []
+
     def __init__(self, x: int, y: int, angle: float, speed: float, *groups) -> None:
         """Initialize a scatter projectile.
 
@@ -209,21 +287,14 @@ class ScatterProjectile(pygame.sprite.Sprite):
         """
         super().__init__(*groups)
 
-        # Create projectile surface (slightly smaller than regular bullet)
-        size = (BULLET_SIZE[0] * 3, BULLET_SIZE[1] * 3)
-        self.image = pygame.Surface(size, pygame.SRCALPHA)
+        if not ScatterProjectile._IMAGES:
+            ScatterProjectile._build_images()
 
-        # Draw the projectile as a yellow-orange circle
-        pygame.draw.circle(
-            self.image,
-            random.choice([(255, 100, 0), (255, 200, 0), (255, 50, 0), (255, 150, 50)]),  # Yellow-orange color
-            (size[0] // 2, size[1] // 2),
-            size[0] // 2,
-        )
-
-        # Set up rect and mask
+        # Pick one of the shared yellow-orange projectile images
+        color_index = random.randrange(len(SCATTER_COLORS))
+        self.image, self.mask = ScatterProjectile._IMAGES[color_index]
+        self._fade_frames = ScatterProjectile._FADE_FRAMES[color_index]
         self.rect = self.image.get_rect(center=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
 
         # Calculate velocity from angle and speed
         self.velocity_x = math.cos(angle) * speed
@@ -236,30 +307,49 @@ class ScatterProjectile(pygame.sprite.Sprite):
         # Lifetime in frames
         self.lifetime = 90  # 1 second at 60 FPS
 
+    @classmethod
+    def _build_images(cls) -> None:
+        """Render the image, mask and fade frames for each scatter color."""
+        # Create projectile surface (slightly smaller than regular bullet)
+        size = (BULLET_SIZE[0] * 3, BULLET_SIZE[1] * 3)
+        for color in SCATTER_COLORS:
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            # Draw the projectile as a yellow-orange circle
+            pygame.draw.circle(
+                image,
+                color,
+                (size[0] // 2, size[1] // 2),
+                size[0] // 2,
+            )
+            cls._IMAGES.append((image, pygame.mask.from_surface(image)))
+
+            # Bake the fade-out into per-pixel alpha, indexed by lifetime
+            fade_frames = []
+            for lifetime in range(SCATTER_FADE_FRAMES):
+                frame = image.copy()
+                alpha = int(255 * lifetime / SCATTER_FADE_FRAMES)
+                frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                fade_frames.append(frame)
+            cls._FADE_FRAMES.append(fade_frames)
+
     def update(self) -> None:
         """Update the projectile's position."""
         # Apply velocity
         self.pos_x += self.velocity_x
         self.pos_y += self.velocity_y
 
-        # Update rect based on float position
-        self.rect.x = round(self.pos_x)
-        self.rect.y = round(self.pos_y)
+        # Update rect based on float position; Rect rounds floats itself
+        self.rect.topleft = (self.pos_x, self.pos_y)
 
         # Reduce lifetime
         self.lifetime -= 1
 
-        # Fade out as it nears end of life
-        if self.lifetime < 20:
-            # Calculate fade factor (1.0 to 0.0)
-            fade = self.lifetime / 20.0
-            # Apply alpha
-            self.image.set_alpha(int(255 * fade))
+        # Fade out as it nears end of life using the pre-baked frames
+        if 0 <= self.lifetime < SCATTER_FADE_FRAMES:
+            self.image = self._fade_frames[self.lifetime]
 
         # Remove projectile if lifetime ends or it goes off-screen
-        screen = pygame.display.get_surface()
-        screen_rect = screen.get_rect()
-        if self.lifetime <= 0 or not self.rect.colliderect(screen_rect):
+        if self.lifetime <= 0 or not self.rect.colliderect(SCREEN_RECT):
             self.kill()
 
 
@@ -276,8 +366,7 @@ class LaserBeam(pygame.sprite.Sprite):
         # Calculate beam dimensions with offset to start in front of ship
         ship_width_estimate = 50  # Estimated width of player ship
         beam_start_x = player_pos[0] + ship_width_estimate//2  # Start from front of ship
-        screen_width = pygame.display.get_surface().get_width()
-        beam_length = screen_width - beam_start_x
+        beam_length = SCREEN_WIDTH - beam_start_x
 
         # Safety check for beam_length
         if beam_length <= 0:
@@ -318,9 +407,13 @@ class LaserBeam(pygame.sprite.Sprite):
         self.fade_in_speed = 0.15    # How quickly the beam extends
         
         # Particle effect variables
-        self.particles = []
         self.particle_spawn_rate = int(3 + charge_level * 1.5)  # Further reduced spawn rate
         self.max_particles = 80  # Further reduced max particles
+        # Particle records; only the first particle_count entries are live
+        self.particle_count = 0
+        self._particles = np.zeros(self.max_particles, dtype=LASER_PARTICLE_DTYPE)
+        # The same records seen as a plain (max_particles, fields) table
+        self._particle_table = self._particles.view(np.float32).reshape(self.max_particles, -1)
         self.particle_size_range = (1, 3)  # Smaller max size
         self.particle_speed_range = (3, 7)
         self.particle_spread = int(6 + charge_level * 4)  # Further reduced spread
@@ -332,15 +425,17 @@ class LaserBeam(pygame.sprite.Sprite):
         self.color_phase = 0
         self.color_shift = random.uniform(0, 2 * math.pi)
         
-        # Set up rect and mask - Position from the front of the ship
+        # Set up rect - Position from the front of the ship
         self.rect = self.image.get_rect(midleft=(beam_start_x, player_pos[1]))
 
+        # Collision mask is a solid band along the beam, rebuilt only while
+        # the visible length changes during fade-in
+        self.mask = pygame.mask.Mask(self.image.get_size())
+        self._mask_length = -1
+
         # Draw initial beam
         self._draw_beam()
 
-        # Create mask from image (important for collision detection)
-        self.mask = pygame.mask.from_surface(self.image)
-
         # Set lifetime and damage
         self.lifetime = 30 + int(15 * charge_level)
         self.damage = 2 + int(charge_level * 4)
@@ -350,7 +445,7 @@ class LaserBeam(pygame.sprite.Sprite):
     def _spawn_particles(self):
         """Create new particles across the entire beam."""
         # Only spawn if we haven't exceeded max particles
-        if len(self.particles) >= self.max_particles:
+        if self.particle_count >= self.max_particles:
             return
             
         center_y = self.center_y
@@ -364,57 +459,68 @@ class LaserBeam(pygame.sprite.Sprite):
         if visible_length <= 0:
             return
         
-        # Spawn particles throughout the beam
-        for _ in range(self.particle_spawn_rate):
-            if len(self.particles) >= self.max_particles:
-                break
-                
-            # Randomize particle properties
-            size = random.uniform(self.particle_size_range[0], self.particle_size_range[1])
-            speed = random.uniform(self.particle_speed_range[0], self.particle_speed_range[1])
-            
-            # Position particles anywhere along the visible beam
-            x_pos = random.uniform(0, visible_length)
-            y_offset = random.uniform(-self.particle_spread, self.particle_spread)
-            
-            # Shorter lifespan for particles that start further along the beam
-            max_lifespan = 60 - int(45 * (x_pos / self.beam_length))
-            lifespan = random.randint(10, max(10, max_lifespan))
-            
-            # Create new particle
-            particle = {
-                'x': x_pos,
-                'y': center_y + y_offset,
-                'size': size,
-                'speed': speed,
-                'y_drift': random.uniform(-0.5, 0.5),  # Slow vertical drift
-                'lifespan': lifespan,
-                'pulse_offset': random.uniform(0, 2 * math.pi),  # Random pulse phase
-                'oscillation': random.uniform(0.2, 1.0)  # Random oscillation amplitude
-            }
-            
-            self.particles.append(particle)
+        # Spawn a batch of particles throughout the beam, drawing every
+        # random property of the batch in a single generator call
+        start = self.particle_count
+        count = min(self.particle_spawn_rate, self.max_particles - start)
+        if count <= 0:
+            return
+        spread = self.particle_spread
+        size_low, size_high = self.particle_size_range
+        speed_low, speed_high = self.particle_speed_range
+        # Column ranges in LASER_PARTICLE_DTYPE field order; particles go
+        # anywhere along the visible beam and life is scaled below
+        low = (0.0, center_y - spread, size_low, speed_low, -0.5, 0.0, 0.0, 0.2)
+        span = (
+            visible_length,
+            2 * spread,
+            size_high - size_low,
+            speed_high - speed_low,
+            1.0,
+            1.0,
+            2 * math.pi,
+            0.8,
+        )
+        new = _rng.random((count, len(low)), dtype=np.float32)
+        new *= span
+        new += low
+
+        # Shorter lifespan for particles that start further along the beam
+        max_lifespan = np.maximum(10, 60 - (45 * (new[:, 0] / self.beam_length)).astype(np.int32))
+        new[:, 5] = np.floor(10 + new[:, 5] * (max_lifespan - 9))
+
+        self._particle_table[start:start + count] = new
+        self.particle_count = start + count
 
     def _update_particles(self):
         """Update all particles' positions and properties."""
         # Update color animation
         self.color_phase += 0.08
         
-        # Update particles
-        for particle in self.particles[:]:  # Use a copy to safely remove during iteration
-            # Move particle
-            particle['x'] += particle['speed']
-            
-            # Add oscillating vertical movement
-            y_oscil = math.sin(self.pulse_time * 0.3 + particle['pulse_offset']) * particle['oscillation'] * self.particle_spread * 0.3
-            particle['y'] += particle['y_drift'] + y_oscil
-            
-            # Reduce lifespan
-            particle['lifespan'] -= 1
-            
-            # Remove if expired or out of bounds
-            if particle['lifespan'] <= 0 or particle['x'] >= self.beam_length:
-                self.particles.remove(particle)
+        n = self.particle_count
+        if n == 0:
+            return
+
+        # Move particles along the beam with an oscillating vertical drift
+        particles = self._particles[:n]
+        px = particles["x"]
+        px += particles["speed"]
+        y_oscil = np.sin(self.pulse_time * 0.3 + particles["phase"])
+        y_oscil *= particles["amp"]
+        y_oscil *= self.particle_spread * 0.3
+        py = particles["y"]
+        py += particles["drift"] + y_oscil
+
+        # Reduce lifespan
+        life = particles["life"]
+        life -= 1
+
+        # Compact the records, dropping expired or out-of-bounds particles
+        live = (life > 0) & (px < self.beam_length)
+        kept = int(np.count_nonzero(live))
+        if kept < n:
+            self._particles[:kept] = particles[live]
+            self.particle_count = kept
 
     def _draw_beam(self):
         """Draw the thin central beam and particle effects."""
@@ -423,12 +529,10 @@ class LaserBeam(pygame.sprite.Sprite):
             logger.warning("Attempted to draw beam with non-positive length in _draw_beam.")
             return
 
-        # Clear surface
-        self.image.fill((0, 0, 0, 0))
-
         center_y = self.center_y
-        
+
         # Update fade-in animation
+        was_fading_in = self.is_fading_in
         if self.is_fading_in:
             self.fade_in_progress = min(1.0, self.fade_in_progress + self.fade_in_speed)
             if self.fade_in_progress >= 1.0:
@@ -447,6 +551,14 @@ class LaserBeam(pygame.sprite.Sprite):
             
             # Update existing particles
             self._update_particles()
+        elif not was_fading_in:
+            # Particles and colors only change on update frames, so the beam
+            # drawn on the previous frame is still current
+            self.pulse_time += 0.1
+            return
+
+        # Clear surface
+        self.image.fill((0, 0, 0, 0))
 
         # Calculate color cycle once per draw call for efficiency
         cycle = 0.5 + 0.5 * math.sin(self.color_phase + self.color_shift)
@@ -464,9 +576,8 @@ class LaserBeam(pygame.sprite.Sprite):
                 (0, core_top, visible_length, core_height)
             )
         
-        # Add subtle pulsing effect, but calculate less frequently
+        # Advance the pulse animation that drives particle oscillation
         self.pulse_time += 0.1
-        pulse = 0.8 + 0.2 * math.sin(self.pulse_time * 0.5)
         
         # Add a single source point ball instead of multiple circles
         ball_radius = 6
@@ -478,35 +589,40 @@ class LaserBeam(pygame.sprite.Sprite):
             ball_radius
         )
             
-        # Draw all particles
-        for particle in self.particles:
+        # Draw all particles, computing their colors for the whole batch
+        n = self.particle_count
+        if n:
+            particles = self._particles[:n]
+            xs = particles["x"]
+            ys = particles["y"]
+            sizes = particles["size"]
             # Only draw particles within the visible beam length during fade-in
-            if self.is_fading_in and particle['x'] > visible_length:
-                continue
-                
-            # Calculate distance ratio from source (0 at source, 1 at end)
-            distance_ratio = particle['x'] / self.beam_length
-            size_ratio = (particle['size'] - self.particle_size_range[0]) / (self.particle_size_range[1] - self.particle_size_range[0])
-            
-            # Get dynamic color based on distance and size - simpler calculation
+            if self.is_fading_in:
+                visible = xs <= visible_length
+                xs, ys, sizes = xs[visible], ys[visible], sizes[visible]
+
+            # Distance ratio from source (0 at source, 1 at end)
+            distance_ratio = xs / self.beam_length
+
+            # Dynamic color based on distance - red only depends on the cycle
             r = int(40 + 80 * cycle)
-            g = min(255, int(200 + 55 * (1 - distance_ratio * 0.5)))
-            b = int(50 + 80 * cycle * (1 - distance_ratio))
-            alpha = max(30, min(200, int(180 * (1 - distance_ratio * 0.3))))
-            
-            color = (r, g, b, alpha)
-            
-            # Draw the particle - with smaller max size
-            x, y = int(particle['x']), int(particle['y'])
-            size = max(1, particle['size'])  # Simplified size calculation
-            
-            pygame.draw.circle(
-                self.image,
-                color,
-                (x, y),
-                size
-            )
-        
+            g = np.minimum(255, (200 + 55 * (1 - distance_ratio * 0.5)).astype(np.int32))
+            b = (50 + 80 * cycle * (1 - distance_ratio)).astype(np.int32)
+            alpha = np.clip((180 * (1 - distance_ratio * 0.3)).astype(np.int32), 30, 200)
+
+            # Draw the particles - with smaller max size
+            image = self.image
+            draw_circle = pygame.draw.circle
+            for x, y, g_val, b_val, a_val, size in zip(
+                xs.astype(np.int32).tolist(),
+                ys.astype(np.int32).tolist(),
+                g.tolist(),
+                b.tolist(),
+                alpha.tolist(),
+                np.maximum(1.0, sizes).tolist(),
+            ):
+                draw_circle(image, (r, g_val, b_val, a_val), (x, y), size)
+
         # Add occasional energy bursts, but less frequently
         if random.random() < 0.1:
             # Only create bursts within visible beam
@@ -536,10 +652,27 @@ class LaserBeam(pygame.sprite.Sprite):
                 self.particle_spread // 2
             )
 
-        # Don't update mask every frame - only update when particles are updated
-        if self.update_frame:
-            # Update mask for accurate collision detection
-            self.mask = pygame.mask.from_surface(self.image)
+        # Particles are decorative, so the mask only tracks the visible beam
+        if visible_length != self._mask_length:
+            self._update_mask(visible_length)
+
+    def _update_mask(self, visible_length: int) -> None:
+        """Build the collision mask as a band covering the visible beam.
+
+        The band spans the core beam plus the particle spread so hits match
+        the drawn beam without scanning the surface pixels.
+
+        Args:
+            visible_length: Length of the beam currently drawn, in pixels
+        """
+        width, height = self.image.get_size()
+        self.mask = pygame.mask.Mask((width, height))
+        band_length = min(width, visible_length)
+        band_height = min(height, self.beam_height + 2 * self.particle_spread)
+        if band_length > 0 and band_height > 0:
+            band = pygame.mask.Mask((band_length, band_height), fill=True)
+            self.mask.draw(band, (0, self.center_y - band_height // 2))
+        self._mask_length = visible_length
 
     def update(self):
         """Update the beam animation and lifetime."""
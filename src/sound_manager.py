@@ -1,7 +1,7 @@
 """Sound manager for the game."""
 
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import pygame
 
@@ -11,6 +11,27 @@ from src.logger import get_logger
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# Sounds played instead when a sound is missing or fails to play
+SOUND_FALLBACKS: Dict[str, str] = {
+    "beam": "laser",
+    "scatter": "explosion1",
+    "flamethrower": "laser",  # Fallback sound for flamethrower (uses laser)
+    "flamethrower1": "flamethrower",  # Fallback to regular flamethrower sound
+}
+
+# Fallbacks for looping sounds
+LOOP_FALLBACKS: Dict[str, str] = {
+    "laserbeam": "laser",
+}
+
+# Playback volume of a sound as (multiple of the base volume, upper limit)
+PLAY_VOLUMES: Dict[str, Tuple[float, float]] = {
+    "laser": (0.25, 1.0),  # Laser sounds are much quieter
+    "flamethrower1": (1.5, 0.8),  # Flamethrower is slightly lower
+}
+# Other sounds are loaded at 1.5x the base volume and boosted 1.5x on play
+DEFAULT_PLAY_VOLUME: Tuple[float, float] = (2.25, 1.0)
+
 
 class SoundManager:
     """Manages game sound effects and music."""
@@ -25,6 +46,12 @@ class SoundManager:
         # Track currently looping sounds to stop them when needed
         self.looping_sounds: Dict[str, Dict[str, pygame.mixer.Channel]] = {"player": {}, "enemy": {}}
 
+        # Silent sound shared by every fallback, created on first use
+        self._silent_sound: Optional[pygame.mixer.Sound] = None
+
+        # Filenames of deferred sounds that have not been decoded yet
+        self._deferred_sounds: Dict[str, Dict[str, str]] = {"player": {}, "enemy": {}}
+
         # Ensure pygame mixer is initialized
         if not pygame.mixer.get_init():
             pygame.mixer.init()
@@ -36,12 +63,13 @@ class SoundManager:
         self.volume = DEFAULT_SOUND_VOLUME
         self.music_volume = DEFAULT_SOUND_VOLUME
         self.current_music = None
+        self._update_play_volumes()
 
         # Load sound effects
         self._load_sounds()
 
     def _load_sounds(self) -> None:
-        """Load all sound effects into memory."""
+        """Load sound effects into memory, deferring the rarely used ones."""
         # Create silent fallbacks for all required sounds
         self._create_silent_sound("laser", "player")
         self._create_silent_sound("explosion1", "player")
@@ -67,16 +95,68 @@ class SoundManager:
         # Use player powerup sound for enemy too
         self._try_load_sound("explosion2", "explosion2.ogg", "enemy")
         self._try_load_sound("powerup1", "powerup1.ogg", "enemy")
-        self._try_load_sound("bossexplode1", "bossexplode1.ogg", "enemy")  # Load boss explosion sound
-        self._try_load_sound("siren1", "siren1.ogg", "enemy")  # Load siren sound for boss intro
+
+        # The long boss-only sounds are decoded when the boss intro is set up
+        # (see preload) instead of at startup
+        self._defer_sound("bossexplode1", "bossexplode1.ogg", "enemy")  # Boss explosion sound
+        self._defer_sound("siren1", "siren1.ogg", "enemy")  # Siren sound for boss intro
+
+    def _defer_sound(self, name: str, filename: str, category: str = "player") -> None:
+        """Register a sound file to be loaded the first time it is needed.
+
+        Args:
+            name: Reference name for the sound
+            filename: Filename of the sound file
+            category: Category the sound belongs to
+        """
+        self._deferred_sounds[category][name] = filename
+
+    def preload(self, *names: str, category: str = "enemy") -> None:
+        """Decode deferred sounds ahead of time so their first play doesn't stall a frame.
+
+        Call this at a loading point before the sounds are needed, such as
+        when a boss intro is being set up.
+
+        Args:
+            names: Reference names of the sounds to load
+            category: Category the sounds belong to
+        """
+        for name in names:
+            self._load_deferred_sound(name, category)
+
+    def _load_deferred_sound(self, name: str, category: str) -> None:
+        """Load a deferred sound if it has not been loaded yet.
+
+        Args:
+            name: Reference name for the sound
+            category: Category the sound belongs to
+        """
+        deferred = self._deferred_sounds.get(category)
+        if deferred and name in deferred:
+            self._try_load_sound(name, deferred.pop(name), category)
 
     def _create_silent_sound(self, name: str, category: str) -> None:
-        """Create a silent sound as a fallback.
+        """Register the shared silent sound as a fallback.
+
+        Silent fallbacks are all identical, so every name refers to one
+        Sound built on first use.
 
         Args:
             name: Reference name for the sound
             category: Category the sound belongs to
         """
+        if self._silent_sound is None:
+            self._silent_sound = self._build_silent_sound()
+        if self._silent_sound is not None:
+            self.sounds[category][name] = self._silent_sound
+            logger.debug(f"Using silent fallback for {category}/{name}")
+
+    def _build_silent_sound(self) -> Optional[pygame.mixer.Sound]:
+        """Create the silent sound shared by all fallbacks.
+
+        Returns:
+            Optional[pygame.mixer.Sound]: The silent sound, or None if it could not be created
+        """
         try:
             # Create a silent sound (1 second of silence)
             # Use a buffer with proper format for pygame: 44100Hz, 16-bit, mono
@@ -84,8 +164,7 @@ class SoundManager:
             silence_buffer = bytearray(buffer_size)
             silent_sound = pygame.mixer.Sound(buffer=bytes(silence_buffer))
             silent_sound.set_volume(0.01)  # Set to very low volume instead of zero
-            self.sounds[category][name] = silent_sound
-            logger.debug(f"Created silent fallback for {category}/{name}")
+            return silent_sound
         except Exception as e:
             logger.error(f"Failed to create silent sound: {e}")
             # Create the smallest possible sound buffer as last resort
@@ -93,11 +172,11 @@ class SoundManager:
                 minimal_buffer = bytearray(32)  # Smallest possible buffer
                 minimal_sound = pygame.mixer.Sound(buffer=bytes(minimal_buffer))
                 minimal_sound.set_volume(0)  # Mute it completely
-                self.sounds[category][name] = minimal_sound
-                logger.debug(f"Created minimal fallback for {category}/{name}")
+                return minimal_sound
             except Exception as e2:
                 logger.error(f"Failed to create even minimal sound: {e2}")
                 # If we really can't create any sound, log it but don't crash
+                return None
 
     def _try_load_sound(self, name: str, filename: str, category: str = "player") -> None:
         """Try to load a sound file, using fallback if it doesn't exist.
@@ -149,47 +228,41 @@ class SoundManager:
             volume: Optional volume override for this play only
             fadeout_ms: Optional fadeout time in milliseconds for currently playing instances
         """
-        # First make sure the category exists
-        if category not in self.sounds:
+        # First make sure the category exists, looking its table up only once
+        category_sounds = self.sounds.get(category)
+        if category_sounds is None:
             logger.warning(f"Sound category {category} not found")
             return
 
+        # Decode the sound file now if its loading was deferred and it was
+        # not preloaded
+        self._load_deferred_sound(name, category)
+
+        # Fetch the sound with a single lookup; None if it isn't loaded
+        sound = category_sounds.get(name)
+
         # If we need to fadeout other instances of this sound before playing
-        if fadeout_ms > 0 and name in self.sounds[category]:
+        if fadeout_ms > 0 and sound is not None:
             try:
                 # Fadeout previous instances of this sound
-                self.sounds[category][name].fadeout(fadeout_ms)
+                sound.fadeout(fadeout_ms)
             except Exception as e:
                 logger.warning(f"Failed to fadeout sound {category}/{name}: {e}")
 
         # Check if the sound exists and is not None
-        if name in self.sounds[category] and self.sounds[category][name] is not None:
+        if sound is not None:
             try:
                 # Stop the sound if it's already playing to make it start over immediately
-                self.sounds[category][name].stop()
-                
-                # Temporarily boost volume for this play
-                current_volume = self.sounds[category][name].get_volume()
-                
-                # Use override volume if provided
-                if volume is not None:
-                    self.sounds[category][name].set_volume(volume)
-                # Make sure laser sounds are much quieter
-                elif name == "laser":
-                    # For laser sounds, set a fixed volume rather than multiplying the current volume
-                    # This prevents volume decay over repeated plays
-                    self.sounds[category][name].set_volume(self.volume * 0.25)  # 25% of base volume
-                else:
-                    self.sounds[category][name].set_volume(min(1.0, current_volume * 1.5))
+                sound.stop()
 
-                # Adjust volume for flamethrower1 sound to be slightly lower
-                if name == "flamethrower1":
-                    self.sounds[category][name].set_volume(min(0.8, current_volume))
+                # Use override volume if provided, otherwise the precomputed
+                # playback volume, so repeated plays never drift
+                if volume is None:
+                    volume = self._play_volumes.get(name, self._default_play_volume)
+                sound.set_volume(volume)
 
                 # Play the sound
-                self.sounds[category][name].play()
-
-                # Reset to original volume after a short delay (we'll let mixer handle this)
+                sound.play()
                 return
             except pygame.error as e:
                 logger.error(f"Failed to play sound {category}/{name}: {e}")
@@ -197,24 +270,13 @@ class SoundManager:
 
         # If we get here, either the sound doesn't exist or playing it failed
         # Try to use a fallback
-        fallbacks = {
-            "beam": "laser", 
-            "scatter": "explosion1",
-            "flamethrower": "laser",  # Fallback sound for flamethrower (uses laser)
-            "flamethrower1": "flamethrower"  # Fallback to regular flamethrower sound
-        }
-
-        # Check if we have a fallback
-        if name in fallbacks:
-            fallback_name = fallbacks[name]
-            if (
-                fallback_name in self.sounds[category]
-                and self.sounds[category][fallback_name] is not None
-            ):
+        fallback_name = SOUND_FALLBACKS.get(name)
+        if fallback_name is not None:
+            if (fallback_sound := category_sounds.get(fallback_name)) is not None:
                 try:
                     # Stop the fallback sound if it's already playing
-                    self.sounds[category][fallback_name].stop()
-                    self.sounds[category][fallback_name].play()
+                    fallback_sound.stop()
+                    fallback_sound.play()
                     logger.debug(f"Used fallback sound {fallback_name} for {name}")
                     return
                 except pygame.error as e:
@@ -235,6 +297,15 @@ class SoundManager:
         for category in self.sounds:
             for sound in self.sounds[category].values():
                 sound.set_volume(self.volume)
+        self._update_play_volumes()
+
+    def _update_play_volumes(self) -> None:
+        """Precompute the playback volume of each sound from the base volume."""
+        self._play_volumes: Dict[str, float] = {
+            name: min(limit, self.volume * scale) for name, (scale, limit) in PLAY_VOLUMES.items()
+        }
+        scale, limit = DEFAULT_PLAY_VOLUME
+        self._default_play_volume = min(limit, self.volume * scale)
 
     def play_music(self, music_name: str, loops: int = -1, fade_ms: int = 1000) -> bool:
         """Play background music.
@@ -322,13 +393,17 @@ class SoundManager:
             category: Category the sound belongs to
             volume: Optional volume override
         """
-        # First make sure the category exists
-        if category not in self.sounds:
+        # First make sure the category exists, looking its table up only once
+        category_sounds = self.sounds.get(category)
+        if category_sounds is None:
             logger.warning(f"Sound category {category} not found")
             return
+
+        # Decode the sound file now if its loading was deferred
+        self._load_deferred_sound(name, category)
         
         # Check if the sound exists and is not None
-        if name in self.sounds[category] and self.sounds[category][name] is not None:
+        if (sound := category_sounds.get(name)) is not None:
             try:
                 # Find an available channel for the looping sound
                 # Look for a free channel starting from channel 1 (reserving channel 0 for non-looping sounds)
@@ -336,7 +411,6 @@ class SoundManager:
                     channel = pygame.mixer.Channel(channel_id)
                     if not channel.get_busy():
                         # Apply volume settings
-                        sound = self.sounds[category][name]
                         loop_volume = volume if volume is not None else self.volume * 0.6  # Default to 60% of normal volume for loops
                         sound.set_volume(loop_volume)
                         
@@ -360,13 +434,8 @@ class SoundManager:
                 
         # If we get here, either the sound doesn't exist or playing it failed
         # Try to use a fallback
-        fallbacks = {
-            "laserbeam": "laser"
-        }
-        
-        # Check if we have a fallback
-        if name in fallbacks:
-            fallback_name = fallbacks[name]
+        fallback_name = LOOP_FALLBACKS.get(name)
+        if fallback_name is not None:
             self.play_loop(fallback_name, category, volume)  # Try playing the fallback in a loop
         else:
             logger.warning(f"Looping sound {category}/{name} not found and no fallback available")
@@ -410,4 +479,5 @@ class SoundManager:
         Returns:
             Optional[int]: Duration in milliseconds, or None if not found.
         """
+        self._load_deferred_sound(name, category)
         return self.sound_durations.get(category, {}).get(name)